@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Sharded Historical Archive for the docs/ Site
+
+Every build files the day's predictions as one small shard,
+docs/archive/YYYY/MM-DD.json, graded against first-inning results in the
+games table as games go final. Re-filing a date only replaces entries of
+games that have not started: once a game is under way its archived pick
+is kept, so later builds (whose stats include the result) never rewrite
+it. docs/archive/index.json lists one compact entry per date (counts,
+hits, hit rate, games still pending) and is updated in place: today's
+entry is appended or replaced, and only dates that still have pending
+games within ARCHIVE_CONFIG['regrade_days'] are re-graded. No run ever
+rescans the shards.
+"""
+
+import bisect
+import json
+import os
+from datetime import date, timedelta
+import logging
+import config
+import prediction_store
+
+logger = logging.getLogger(__name__)
+
+# Prediction fields kept in a shard
+SHARD_FIELDS = (
+    'key', 'away_team', 'home_team', 'away_pitcher', 'home_pitcher', 'prediction',
+    'yrfi_probability', 'confidence', 'should_bet', 'grade', 'data_quality'
+)
+
+def shard_path(game_date):
+    """Archive-relative path of a date's shard, e.g. 2025/06-01.json"""
+    year, month_day = game_date[:4], game_date[5:10]
+    return f"{year}/{month_day}.json"
+
+def load_results(conn, game_date):
+    """First-inning results for a date keyed like the predictions (None until final)"""
+    results = {}
+    for key, game in prediction_store.slate_games(conn, game_date).items():
+        outcome = prediction_store.first_inning_outcome(game['status'], game['home_first_runs'], game['away_first_runs'])
+        if outcome is None and game['status'] in config.ARCHIVE_CONFIG['void_statuses']:
+            outcome = 'VOID'
+        results[key] = outcome
+    return results
+
+def grade_shard(entries, results):
+    """Fill in actual outcomes and hits; returns the shard's summary"""
+    summary = {'games': len(entries), 'final': 0, 'correct': 0, 'bets': 0, 'graded': 0, 'hits': 0, 'pending': 0}
+    for entry in entries:
+        actual = results.get(entry['key'])
+        entry['actual'] = actual if actual != 'VOID' else None
+        entry['hit'] = entry['prediction'] == actual if actual in ('YRFI', 'NRFI') else None
+
+        if entry['should_bet']:
+            summary['bets'] += 1
+        if actual is None:
+            summary['pending'] += 1
+        elif entry['hit'] is not None:
+            summary['final'] += 1
+            summary['correct'] += entry['hit']
+            if entry['should_bet']:
+                summary['graded'] += 1
+                summary['hits'] += entry['hit']
+
+    # hit_rate covers recommended bets only, accuracy every final game
+    summary['hit_rate'] = round(summary['hits'] / summary['graded'], 4) if summary['graded'] else None
+    summary['accuracy'] = round(summary['correct'] / summary['final'], 4) if summary['final'] else None
+    return summary
+
+def write_json(path, data):
+    """Write minified JSON unless the file already holds it"""
+    content = json.dumps(data, separators=(',', ':'))
+    try:
+        with open(path, encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+def load_index(archive_dir):
+    """The archive index (one entry per date, oldest first)"""
+    try:
+        with open(os.path.join(archive_dir, 'index.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'dates': []}
+
+def upsert_entry(index, entry):
+    """Append a date's entry, or replace it when the date is already listed"""
+    dates = [e['date'] for e in index['dates']]
+    position = bisect.bisect_left(dates, entry['date'])
+    if position < len(dates) and dates[position] == entry['date']:
+        index['dates'][position] = entry
+    else:
+        index['dates'].insert(position, entry)
+
+def archive_entries(predictions):
+    """Shard entries for enhanced predictions (see generate_static_site.enhance_predictions)"""
+    entries = []
+    for pred in predictions:
+        entry = {field: pred.get(field) for field in SHARD_FIELDS}
+        for field in ('yrfi_probability', 'confidence'):
+            if entry[field] is not None:
+                entry[field] = round(entry[field], 4)
+        entries.append(entry)
+    return entries
+
+def file_shard(conn, archive_dir, game_date, entries):
+    """Grade and write a date's shard; returns its index entry"""
+    summary = grade_shard(entries, load_results(conn, game_date))
+    path = shard_path(game_date)
+    write_json(os.path.join(archive_dir, path), {'date': game_date, **summary, 'predictions': entries})
+    return {'date': game_date, 'path': path, **summary}
+
+def load_shard(archive_dir, path):
+    """A shard's contents, or None when it is missing or unreadable"""
+    try:
+        with open(os.path.join(archive_dir, path), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning(f"Skipping archive shard {path}: {e}")
+        return None
+
+def merge_entries(conn, game_date, filed, entries):
+    """Fresh entries for games not yet started, the filed ones for games under way
+
+    Games that started without a filed entry are left out: their pick was
+    not made before first pitch.
+    """
+    statuses = {key: game['status'] for key, game in prediction_store.slate_games(conn, game_date).items()}
+
+    def started(key):
+        return (statuses.get(key) or 'Scheduled') not in prediction_store.PREGAME_STATUSES
+
+    kept = {entry['key']: entry for entry in filed if started(entry['key'])}
+
+    merged = []
+    for entry in entries:
+        if not started(entry['key']):
+            merged.append(entry)
+        elif entry['key'] in kept:
+            merged.append(kept.pop(entry['key']))
+    merged.extend(kept.values())
+    return merged
+
+def update_archive(conn, docs_dir, predictions, today=None):
+    """File the current slate and re-grade recent dates with pending games
+
+    ``predictions`` are enhanced predictions for one slate (all sharing a
+    game_date). Returns (index, whether the index changed).
+    """
+    settings = config.ARCHIVE_CONFIG
+    archive_dir = os.path.join(docs_dir, settings['dir'])
+    index = load_index(archive_dir)
+    slate_date = predictions[0]['game_date'][:10] if predictions else None
+
+    if slate_date:
+        shard = load_shard(archive_dir, shard_path(slate_date))
+        entries = merge_entries(conn, slate_date, shard['predictions'] if shard else [], archive_entries(predictions))
+        upsert_entry(index, file_shard(conn, archive_dir, slate_date, entries))
+
+    # Earlier dates only need another look while some of their games are unfinished
+    cutoff = ((today or date.today()) - timedelta(days=settings['regrade_days'])).isoformat()
+    for entry in index['dates']:
+        if entry['date'] == slate_date or not entry['pending'] or entry['date'] < cutoff:
+            continue
+        shard = load_shard(archive_dir, entry['path'])
+        if shard is None:
+            continue
+        upsert_entry(index, file_shard(conn, archive_dir, entry['date'], shard['predictions']))
+
+    changed = write_json(os.path.join(archive_dir, 'index.json'), index)
+    return index, changed
+
+def archive_totals(index):
+    """Overall hit rate (bets) and accuracy (all final games) across the index"""
+    totals = {
+        field: sum(entry.get(field, 0) for entry in index['dates'])
+        for field in ('final', 'correct', 'graded', 'hits')
+    }
+    return {
+        'dates': len(index['dates']),
+        'final_games': totals['final'],
+        'accuracy': round(totals['correct'] / totals['final'], 4) if totals['final'] else None,
+        'graded_bets': totals['graded'],
+        'hits': totals['hits'],
+        'hit_rate': round(totals['hits'] / totals['graded'], 4) if totals['graded'] else None
+    }
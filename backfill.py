@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Historical Backfill for MLB Predictor
+
+Builds (or extends) the games database from the MLB Stats API one season
+at a time. Each season is split into date-window chunks whose schedules
+are fetched in parallel under a shared rate budget; every chunk is written
+by this process as one transaction and recorded in the backfill_checkpoints
+table, so an interrupted run picks up with the chunks it has not finished.
+
+    python backfill.py 2021-2025
+    python backfill.py 2024 2025 --chunk-days 14 --rate 3
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+import logging
+import config
+from fetch_mlb_data import MLBDataFetcher
+from rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+def create_checkpoint_table(conn):
+    """Create the table of completed backfill chunks"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+            chunk_start TEXT NOT NULL,
+            chunk_end TEXT NOT NULL,
+            game_types TEXT NOT NULL,
+            games INTEGER NOT NULL,
+            completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (chunk_start, chunk_end, game_types)
+        )
+    """)
+    conn.commit()
+
+def completed_chunks(conn, game_types):
+    """(start, end) pairs already backfilled for these game types"""
+    cursor = conn.execute(
+        "SELECT chunk_start, chunk_end FROM backfill_checkpoints WHERE game_types = ?",
+        (game_types,)
+    )
+    return set(cursor.fetchall())
+
+def record_checkpoint(conn, chunk_start, chunk_end, game_types, games):
+    """Mark a chunk as done"""
+    with conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO backfill_checkpoints (chunk_start, chunk_end, game_types, games)
+            VALUES (?, ?, ?, ?)
+        """, (chunk_start, chunk_end, game_types, games))
+
+def season_chunks(season, chunk_days, today=None):
+    """Date windows covering a season's configured span, stopping at today"""
+    if today is None:
+        today = date.today()
+
+    start = date.fromisoformat(f"{season}-{config.BACKFILL_CONFIG['season_start']}")
+    end = min(date.fromisoformat(f"{season}-{config.BACKFILL_CONFIG['season_end']}"), today)
+
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+        chunks.append((start.isoformat(), chunk_end.isoformat()))
+        start = chunk_end + timedelta(days=1)
+    return chunks
+
+def parse_seasons(values):
+    """Expand season arguments like 2023 or 2021-2025"""
+    seasons = []
+    for value in values:
+        first, _, last = value.partition('-')
+        seasons.extend(range(int(first), int(last or first) + 1))
+    return sorted(set(seasons))
+
+def run_backfill(fetcher, seasons, chunk_days=None, workers=None, game_types=None, restart=False):
+    """Backfill seasons through a fetcher; returns (games, rows written, seconds)"""
+    settings = config.BACKFILL_CONFIG
+    chunk_days = chunk_days or settings['chunk_days']
+    workers = workers or settings['workers']
+    game_types = game_types or settings['game_types']
+    today = date.today()
+
+    fetcher.create_tables()
+    create_checkpoint_table(fetcher.conn)
+    done = set() if restart else completed_chunks(fetcher.conn, game_types)
+
+    chunks = [
+        chunk for season in seasons for chunk in season_chunks(season, chunk_days, today)
+        if chunk not in done
+    ]
+    print(f"Backfilling {len(seasons)} season(s): {len(chunks)} chunk(s) of {chunk_days} days to fetch "
+          f"({len(done)} already done)")
+
+    start = time.perf_counter()
+    games_seen = 0
+    rows_written = 0
+    failed = 0
+
+    # Schedules are fetched in parallel; this thread is the only writer
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            pool.submit(fetcher.get_schedule, chunk_start, chunk_end, 'linescore', game_types): (chunk_start, chunk_end)
+            for chunk_start, chunk_end in chunks
+        }
+
+        for i, future in enumerate(as_completed(futures), 1):
+            chunk_start, chunk_end = futures[future]
+            schedule_data = future.result()
+            if schedule_data is None:
+                failed += 1
+                logger.error(f"Chunk {chunk_start}..{chunk_end} failed; it will be retried next run")
+            else:
+                games = sum(len(d.get('games', [])) for d in schedule_data.get('dates', []))
+                written, missing = fetcher.ingest_schedule(schedule_data)
+                rows_written += written
+                games_seen += games
+
+                # Windows reaching today are still changing, so they stay open,
+                # as do windows with games whose feed could not be fetched
+                if missing:
+                    failed += 1
+                    logger.error(f"Chunk {chunk_start}..{chunk_end}: {len(missing)} game(s) not stored; "
+                                 f"it will be retried next run")
+                elif date.fromisoformat(chunk_end) < today:
+                    record_checkpoint(fetcher.conn, chunk_start, chunk_end, game_types, games)
+
+            elapsed = time.perf_counter() - start
+            print(f"  [{i}/{len(chunks)}] {chunk_start}..{chunk_end}: "
+                  f"{games_seen:,} games, {games_seen / elapsed if elapsed else 0:,.0f} games/s")
+
+            if fetcher.circuit_breaker.is_open:
+                logger.error("Stopping backfill: too many consecutive API failures")
+                break
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    if failed:
+        print(f"⚠️ {failed} chunk(s) failed and will be retried on the next run")
+    return games_seen, rows_written, elapsed
+
+def main():
+    """Run a backfill from the command line"""
+    settings = config.BACKFILL_CONFIG
+    parser = argparse.ArgumentParser(description='Backfill historical MLB seasons into the games database')
+    parser.add_argument('seasons', nargs='+', help='Seasons to backfill, e.g. 2024 or 2021-2025')
+    parser.add_argument('--db', default=config.DATABASE_PATH, help='SQLite database path')
+    parser.add_argument('--chunk-days', type=int, default=settings['chunk_days'], help='Days per schedule request')
+    parser.add_argument('--workers', type=int, default=settings['workers'], help='Chunks fetched in parallel')
+    parser.add_argument('--rate', type=float, default=settings['requests_per_second'], help='Request budget (requests/s)')
+    parser.add_argument('--game-types', default=settings['game_types'], help="MLB game types, e.g. 'R' or 'R,F,D,L,W'")
+    parser.add_argument('--restart', action='store_true', help='Ignore checkpoints and fetch every chunk again')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    # Old schedules never change, so the HTTP cache would only fill up
+    fetcher = MLBDataFetcher(args.db, use_http_cache=False)
+    fetcher.rate_limiter = fetcher.api.rate_limiter = TokenBucket(
+        args.rate,
+        min_rate=min(args.rate, config.FETCH_CONFIG['min_requests_per_second'])
+    )
+
+    games, rows, elapsed = run_backfill(
+        fetcher, parse_seasons(args.seasons), args.chunk_days, args.workers, args.game_types, args.restart
+    )
+    fetcher.api.print_stats()
+    fetcher.close()
+
+    print(f"\n✅ Backfilled {games:,} games ({rows:,} rows written) in {elapsed:.1f}s "
+          f"({games / elapsed if elapsed else 0:,.0f} games/s)")
+
+if __name__ == "__main__":
+    main()
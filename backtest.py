@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Point-in-Time Backtester for MLB Predictor
+
+Replays every final game in the database and predicts it using only games
+that finished on earlier dates of the same season. Pitcher, team and league
+aggregates are built as cumulative prefix sums in a single sorted pass, then
+all games are scored at once with the vectorized kernel from predictor.py.
+
+Results are written to the backtest_results table and a JSON summary.
+"""
+
+import argparse
+import json
+import logging
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import config
+import db
+from predictor import LEAGUE_YRFI_RATE, STAT_COLUMNS, score_matchups
+from prediction_store import get_grade_info
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_PATH = 'backtest_results.json'
+
+def load_final_games(conn, seasons=None):
+    """Load final games with their first-inning outcome, sorted by date"""
+    query = """
+    SELECT
+        game_id,
+        game_date,
+        season,
+        home_team_name as home_team,
+        away_team_name as away_team,
+        home_pitcher,
+        away_pitcher,
+        CASE WHEN (COALESCE(away_first_runs, 0) > 0 OR COALESCE(home_first_runs, 0) > 0)
+             THEN 1 ELSE 0 END as yrfi
+    FROM games
+    WHERE status = 'Final'
+    AND season IS NOT NULL
+    """
+    params = []
+    if seasons:
+        query += f" AND season IN ({', '.join('?' for _ in seasons)})"
+        params.extend(seasons)
+
+    games = pd.read_sql_query(query, conn, params=params)
+    games['game_day'] = games['game_date'].astype(str).str[:10]
+    return games.sort_values(['season', 'game_day', 'game_id'], kind='mergesort').reset_index(drop=True)
+
+def _prior_stats(games, home_column, away_column):
+    """Games and YRFI count for each side's name over earlier dates of the season
+
+    Returns two (games, yrfi_count) frames aligned with ``games`` for the
+    home and away side.
+    """
+    sides = []
+    for column in (home_column, away_column):
+        side = games[['game_id', 'season', 'game_day', 'yrfi']].copy()
+        side['name'] = games[column]
+        sides.append(side)
+
+    # A name appearing on both sides of one game counts once, like the live queries
+    appearances = pd.concat(sides).dropna(subset=['name']).drop_duplicates(['game_id', 'name'])
+
+    daily = appearances.groupby(['name', 'season', 'game_day']).agg(
+        games=('game_id', 'size'), yrfi_count=('yrfi', 'sum')
+    )
+    # Cumulative totals through each day minus that day's own games
+    prior = daily.groupby(level=['name', 'season']).cumsum() - daily
+
+    results = []
+    for column in (home_column, away_column):
+        keys = pd.MultiIndex.from_arrays([games[column], games['season'], games['game_day']])
+        results.append(prior.reindex(keys).fillna(0).to_numpy(dtype=np.int64))
+    return results
+
+def _prior_league_rate(games):
+    """Point-in-time league YRFI rate per game (historical rate until enough games exist)"""
+    daily = games.groupby(['season', 'game_day']).agg(games=('game_id', 'size'), yrfi_count=('yrfi', 'sum'))
+    prior = daily.groupby(level='season').cumsum() - daily
+
+    keys = pd.MultiIndex.from_arrays([games['season'], games['game_day']])
+    prior = prior.reindex(keys).to_numpy(dtype=np.int64)
+    enough = prior[:, 0] >= config.MIN_LEAGUE_GAMES
+    return np.where(enough, prior[:, 1] / np.maximum(prior[:, 0], 1), LEAGUE_YRFI_RATE)
+
+def build_feature_matrix(conn, seasons=None):
+    """Build the point-in-time feature matrix for every final game
+
+    Returns ``(games, rates, game_counts, league_rates)`` where ``rates`` and
+    ``game_counts`` are (N, 4) arrays in STAT_COLUMNS order suitable for
+    predictor.score_matchups.
+    """
+    games = load_final_games(conn, seasons)
+
+    home_pitcher, away_pitcher = _prior_stats(games, 'home_pitcher', 'away_pitcher')
+    home_team, away_team = _prior_stats(games, 'home_team', 'away_team')
+    minimums = np.array([config.MIN_PITCHER_GAMES] * 2 + [config.MIN_TEAM_GAMES] * 2)
+
+    counts = np.stack([home_pitcher[:, 0], away_pitcher[:, 0], home_team[:, 0], away_team[:, 0]], axis=1)
+    yrfi_counts = np.stack([home_pitcher[:, 1], away_pitcher[:, 1], home_team[:, 1], away_team[:, 1]], axis=1)
+
+    # Below the minimum sample the predictor treats stats as missing
+    has_stats = counts >= minimums
+    rates = np.where(has_stats, yrfi_counts / np.maximum(counts, 1), np.nan)
+    game_counts = np.where(has_stats, counts, 0)
+
+    assert rates.shape[1] == len(STAT_COLUMNS)
+    return games, rates, game_counts, _prior_league_rate(games)
+
+def run_backtest(conn, seasons=None, **params):
+    """Score every final game point-in-time; returns a per-game DataFrame"""
+    games, rates, game_counts, league_rates = build_feature_matrix(conn, seasons)
+    if len(games) == 0:
+        return games
+
+    scores = score_matchups(rates, game_counts, league_yrfi_rate=league_rates, **params)
+
+    results = games[['game_id', 'game_date', 'season', 'home_team', 'away_team',
+                     'home_pitcher', 'away_pitcher']].copy()
+    results['yrfi_probability'] = scores['yrfi_probability']
+    results['confidence'] = scores['confidence']
+    results['should_bet'] = scores['should_bet']
+    results['data_quality'] = scores['data_quality']
+    results['quality_score'] = scores['quality_score']
+    results['prediction'] = np.where(scores['yrfi_probability'] > 0.5, 'YRFI', 'NRFI')
+    results['grade'] = [
+        get_grade_info(confidence, should_bet)[0]
+        for confidence, should_bet in zip(results['confidence'], results['should_bet'])
+    ]
+    results['actual'] = np.where(games['yrfi'] == 1, 'YRFI', 'NRFI')
+    results['correct'] = results['prediction'] == results['actual']
+    return results
+
+def _hit_rates(results):
+    """Prediction and bet hit rates for a group of backtest rows"""
+    bets = results[results['should_bet']]
+    return {
+        'games': int(len(results)),
+        'accuracy': round(float(results['correct'].mean()), 4) if len(results) else None,
+        'bets': int(len(bets)),
+        'bet_wins': int(bets['correct'].sum()),
+        'bet_hit_rate': round(float(bets['correct'].mean()), 4) if len(bets) else None
+    }
+
+def summarize(results):
+    """Summary hit rates overall and by season, grade and data quality"""
+    return {
+        'overall': _hit_rates(results),
+        'by_season': {str(k): _hit_rates(g) for k, g in results.groupby('season')},
+        'by_grade': {k: _hit_rates(g) for k, g in results.groupby('grade')},
+        'by_data_quality': {k: _hit_rates(g) for k, g in results.groupby('data_quality')}
+    }
+
+def save_results(conn, results):
+    """Replace backtest_results rows for the replayed seasons"""
+    cursor = conn.cursor()
+
+    # Tables created before game_id matched games.game_id (TEXT) are rebuilt
+    existing = {row[1]: row[2] for row in cursor.execute("PRAGMA table_info(backtest_results)")}
+    if existing.get('game_id') == 'INTEGER':
+        cursor.execute("ALTER TABLE backtest_results RENAME TO backtest_results_old")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_results (
+            game_id TEXT PRIMARY KEY,
+            game_date TEXT,
+            season INTEGER,
+            home_team TEXT,
+            away_team TEXT,
+            home_pitcher TEXT,
+            away_pitcher TEXT,
+            prediction TEXT,
+            yrfi_probability REAL,
+            confidence REAL,
+            should_bet INTEGER,
+            data_quality TEXT,
+            quality_score INTEGER,
+            grade TEXT,
+            actual TEXT,
+            correct INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    if existing.get('game_id') == 'INTEGER':
+        cursor.execute("""
+            INSERT INTO backtest_results SELECT CAST(game_id AS TEXT), game_date, season, home_team,
+                away_team, home_pitcher, away_pitcher, prediction, yrfi_probability, confidence,
+                should_bet, data_quality, quality_score, grade, actual, correct, created_at
+            FROM backtest_results_old
+        """)
+        cursor.execute("DROP TABLE backtest_results_old")
+
+    seasons = sorted(int(s) for s in results['season'].unique())
+    if seasons:
+        cursor.execute(
+            f"DELETE FROM backtest_results WHERE season IN ({', '.join('?' for _ in seasons)})",
+            seasons
+        )
+
+    columns = ['game_id', 'game_date', 'season', 'home_team', 'away_team', 'home_pitcher',
+               'away_pitcher', 'prediction', 'yrfi_probability', 'confidence', 'should_bet',
+               'data_quality', 'quality_score', 'grade', 'actual', 'correct']
+    rows = results[columns].astype(object).where(results[columns].notna(), None)
+    cursor.executemany(
+        f"INSERT INTO backtest_results ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+        [
+            tuple(value.item() if isinstance(value, np.generic) else value for value in row)
+            for row in rows.itertuples(index=False)
+        ]
+    )
+    conn.commit()
+
+def generate_backtest_json(results):
+    """Per-game backtest predictions and summary as JSON"""
+    games = results.astype(object).where(results.notna(), None)
+    data = {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'summary': summarize(results),
+        'games': [
+            {k: (v.item() if isinstance(v, np.generic) else v) for k, v in row.items()}
+            for row in games.to_dict(orient='records')
+        ]
+    }
+    return json.dumps(data, indent=2)
+
+def main():
+    """Run the backtest from the command line"""
+    parser = argparse.ArgumentParser(description='Point-in-time backtest of the MLB YRFI/NRFI predictor')
+    parser.add_argument('--db', default=config.DATABASE_PATH, help='SQLite database path')
+    parser.add_argument('--season', type=int, action='append', help='Season to replay (repeatable, default: all)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='JSON output path')
+    parser.add_argument('--no-save', action='store_true', help='Do not write the backtest_results table')
+    args = parser.parse_args()
+
+    print("Running point-in-time backtest...")
+    conn = db.connect_writer(args.db)
+    results = run_backtest(conn, args.season)
+
+    if len(results) == 0:
+        print("No final games to replay")
+        conn.close()
+        return
+
+    if not args.no_save:
+        save_results(conn, results)
+        print(f"Saved {len(results)} rows to backtest_results")
+    conn.close()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(generate_backtest_json(results))
+    print(f"Generated {args.output}")
+
+    summary = summarize(results)
+    overall = summary['overall']
+    print(f"\nGames replayed: {overall['games']}")
+    print(f"Accuracy: {overall['accuracy']:.1%}")
+    if overall['bets']:
+        print(f"Bets: {overall['bets']} ({overall['bet_hit_rate']:.1%} hit rate)")
+
+    print("\nBy grade:")
+    for grade, stats in summary['by_grade'].items():
+        hit_rate = f"{stats['bet_hit_rate']:.1%}" if stats['bet_hit_rate'] is not None else 'n/a'
+        print(f"  {grade:>3}: {stats['games']:>5} games, {stats['accuracy']:.1%} accuracy, bet hit rate {hit_rate}")
+
+    print("\nBy data quality:")
+    for quality, stats in summary['by_data_quality'].items():
+        print(f"  {quality:>9}: {stats['games']:>5} games, {stats['accuracy']:.1%} accuracy")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for MLB Predictor
+
+Times the main workloads against synthetic databases of increasing size
+(see synthetic_data.py):
+
+- daily_predictions: one slate with the materialized season aggregates
+- daily_predictions_raw: the same slate aggregated from the games table
+- backtest: point-in-time replay of every final game
+- ingest: MLBDataFetcher.update_games flipping a batch of games to Final
+  from one hydrated schedule document, with API responses served from
+  memory so only the parse and write path is timed
+- render_static_site: generate_html_content for a large list of cards
+
+Each run appends one JSON line to benchmark_results.jsonl so results can be
+compared across commits.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import time
+from datetime import datetime
+import config
+from synthetic_data import create_synthetic_database, parse_scale
+
+DEFAULT_SCALES = ('10k', '100k', '1M')
+DEFAULT_RESULTS_PATH = 'benchmark_results.jsonl'
+DEFAULT_DATA_DIR = 'bench_data'
+INGEST_GAMES = 1000
+RENDER_CARDS = 5000
+
+def best_of(func, repeat):
+    """Best wall time of several runs (the first result is returned too)"""
+    timings = []
+    result = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        value = func()
+        timings.append(time.perf_counter() - start)
+        if i == 0:
+            result = value
+    return min(timings), result
+
+def _next_slate_date(db_path):
+    """First unplayed date of the current season, like a live daily run"""
+    conn = sqlite3.connect(db_path)
+    row = conn.execute("""
+        SELECT MIN(game_date) FROM games
+        WHERE season = ? AND status != 'Final'
+    """, (config.CURRENT_SEASON,)).fetchone()
+    conn.close()
+    return row[0]
+
+def bench_daily_predictions(db_path, repeat, raw=False):
+    """Time one daily slate without the prediction cache"""
+    from predictor import MLBPredictor
+
+    target_date = _next_slate_date(db_path)
+    predictor = MLBPredictor(db_path, use_cache=False)
+    if raw:
+        predictor.has_season_stats = False
+    seconds, predictions = best_of(lambda: predictor.get_daily_predictions(target_date), repeat)
+    return {'seconds': seconds, 'games': len(predictions)}
+
+def bench_backtest(db_path, repeat):
+    """Time a full point-in-time backtest"""
+    from backtest import run_backtest
+
+    conn = sqlite3.connect(db_path)
+    seconds, results = best_of(lambda: run_backtest(conn), repeat)
+    conn.close()
+    return {'seconds': seconds, 'games': len(results)}
+
+class _OfflineFetcher:
+    """Serve schedule and game feed documents from memory for ingest timing"""
+
+    def __init__(self, games):
+        """Index the queued games by id"""
+        self.games = {game['game_id']: game for game in games}
+
+    def get_schedule(self, start_date, end_date, profile=None):
+        """Schedule document with linescore and probablePitcher hydrations"""
+        dates = {}
+        for game in self.games.values():
+            dates.setdefault(game['game_date'], []).append({
+                'gamePk': game['game_id'],
+                'season': str(game['season']),
+                'status': {'detailedState': 'Final'},
+                'teams': {
+                    'home': {'team': {'name': game['home_team_name']}, 'probablePitcher': {'fullName': game['home_pitcher']}},
+                    'away': {'team': {'name': game['away_team_name']}, 'probablePitcher': {'fullName': game['away_pitcher']}}
+                },
+                'linescore': {
+                    'innings': [{'home': {'runs': game['home_first_runs']}, 'away': {'runs': game['away_first_runs']}}],
+                    'teams': {'home': {'runs': game['home_score']}, 'away': {'runs': game['away_score']}}
+                }
+            })
+        return {'dates': [{'date': d, 'games': g} for d, g in sorted(dates.items())]}
+
+    def get_game_details(self, game_id, only_changed=False):
+        """Final game feed document built from the stored row"""
+        game = self.games[game_id]
+        return {
+            'gameData': {
+                'game': {'season': game['season']},
+                'status': {'detailedState': 'Final'},
+                'teams': {
+                    'home': {'name': game['home_team_name'], 'probablePitcher': {'fullName': game['home_pitcher']}},
+                    'away': {'name': game['away_team_name'], 'probablePitcher': {'fullName': game['away_pitcher']}}
+                }
+            },
+            'liveData': {
+                'linescore': {
+                    'innings': [{'home': {'runs': game['home_first_runs']}, 'away': {'runs': game['away_first_runs']}}],
+                    'teams': {'home': {'runs': game['home_score']}, 'away': {'runs': game['away_score']}}
+                }
+            }
+        }
+
+def bench_ingest(db_path, data_dir):
+    """Time update_games re-finalizing the most recent final games"""
+    from fetch_mlb_data import MLBDataFetcher
+
+    work_path = os.path.join(data_dir, 'ingest_work.db')
+    shutil.copyfile(db_path, work_path)
+
+    conn = sqlite3.connect(work_path)
+    conn.row_factory = sqlite3.Row
+    games = [dict(row) for row in conn.execute("""
+        SELECT * FROM games WHERE status = 'Final'
+        ORDER BY game_date DESC LIMIT ?
+    """, (INGEST_GAMES,))]
+    conn.executemany(
+        "UPDATE games SET status = 'Scheduled' WHERE game_id = ?",
+        [(game['game_id'],) for game in games]
+    )
+    conn.commit()
+    conn.close()
+
+    fetcher = MLBDataFetcher(work_path, use_http_cache=False)
+    offline = _OfflineFetcher(games)
+    fetcher.get_schedule = offline.get_schedule
+    fetcher.get_game_details = offline.get_game_details
+
+    start = time.perf_counter()
+    fetcher.update_games()
+    seconds = time.perf_counter() - start
+    fetcher.close()
+    os.remove(work_path)
+    return {'seconds': seconds, 'games': len(games)}
+
+def bench_render_static_site(db_path, repeat):
+    """Time rendering the static site page for many prediction cards"""
+    from backtest import run_backtest
+    from generate_static_site import generate_html_content
+
+    conn = sqlite3.connect(db_path)
+    results = run_backtest(conn).tail(RENDER_CARDS)
+    conn.close()
+    predictions = [
+        {
+            'prediction': row.prediction,
+            'confidence': float(row.confidence),
+            'should_bet': bool(row.should_bet),
+            'data_quality': row.data_quality,
+            'home_team': row.home_team,
+            'away_team': row.away_team,
+            'home_pitcher': row.home_pitcher,
+            'away_pitcher': row.away_pitcher
+        }
+        for row in results.itertuples()
+    ]
+
+    seconds, html = best_of(lambda: generate_html_content(predictions), repeat)
+    return {'seconds': seconds, 'cards': len(predictions), 'bytes': len(html.encode('utf-8'))}
+
+def _git_commit():
+    """Current commit hash, if available"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+def run_benchmarks(scale, data_dir, repeat, regenerate=False):
+    """Run every benchmark against a synthetic database of the given scale"""
+    games = parse_scale(scale)
+    db_path = os.path.join(data_dir, f"synthetic_{games}.db")
+
+    if regenerate or not os.path.exists(db_path):
+        print(f"Generating synthetic database with {games:,} games...")
+        start = time.perf_counter()
+        create_synthetic_database(db_path, games)
+        print(f"  generated in {time.perf_counter() - start:.1f}s")
+
+    results = {
+        'daily_predictions': bench_daily_predictions(db_path, repeat),
+        'daily_predictions_raw': bench_daily_predictions(db_path, repeat, raw=True),
+        'backtest': bench_backtest(db_path, repeat),
+        'ingest': bench_ingest(db_path, data_dir),
+        'render_static_site': bench_render_static_site(db_path, repeat)
+    }
+    return games, results
+
+def main():
+    """Run the benchmark suite from the command line"""
+    parser = argparse.ArgumentParser(description='Benchmark the MLB predictor on synthetic databases')
+    parser.add_argument('--scale', action='append', help='Database size, e.g. 10k, 100k, 1M (repeatable)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per benchmark (best time is kept)')
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help='Directory for generated databases')
+    parser.add_argument('--regenerate', action='store_true', help='Regenerate databases even if present')
+    parser.add_argument('--output', default=DEFAULT_RESULTS_PATH, help='JSON lines file to append results to')
+    args = parser.parse_args()
+
+    # Keep per-game prediction logging out of the timings
+    logging.disable(logging.INFO)
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    for scale in args.scale or DEFAULT_SCALES:
+        games, results = run_benchmarks(scale, args.data_dir, args.repeat, args.regenerate)
+
+        print(f"\n📊 {games:,} games")
+        print("-" * 50)
+        for name, result in results.items():
+            extra = ', '.join(f"{k}={v}" for k, v in result.items() if k != 'seconds')
+            print(f"{name:<24} {result['seconds'] * 1000:10.1f} ms  ({extra})")
+
+        record = {
+            'run_at': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'games': games,
+            'results': results
+        }
+        with open(args.output, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+    print(f"\nResults appended to {args.output}")
+
+if __name__ == "__main__":
+    main()
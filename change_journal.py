@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Row-Level Change Journal for the Games Table
+
+MLBDataFetcher.store_games appends one game_changes row per written game,
+in the same transaction as the write: the game, its date, the columns that
+changed, whether the game is (or was) final, and a monotonically
+increasing version. Renderers remember the version they last built from
+and use changes_since() / needs_rebuild() to skip regeneration when
+nothing that affects their output has changed.
+
+A change matters to today's page when it touches a game on today's date
+(slate, pitchers, live status) or a final game (season stats, and so
+every prediction).
+"""
+
+import json
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+def create_journal_table(conn):
+    """Create the game_changes table if needed"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS game_changes (
+            version INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_id TEXT NOT NULL,
+            game_date TEXT,
+            changed_columns TEXT NOT NULL,
+            final INTEGER NOT NULL DEFAULT 0,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_game_changes_date ON game_changes(game_date)")
+
+def has_journal(conn):
+    """Whether the database keeps a change journal"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='game_changes'")
+    return cursor.fetchone() is not None
+
+def record_changes(cursor, changes):
+    """Append (game_id, game_date, changed columns, final) entries to the journal"""
+    cursor.executemany("""
+        INSERT INTO game_changes (game_id, game_date, changed_columns, final)
+        VALUES (?, ?, ?, ?)
+    """, [
+        (str(game_id), game_date, ','.join(columns), int(bool(final)))
+        for game_id, game_date, columns, final in changes
+    ])
+
+def current_version(conn):
+    """Latest journal version (0 when empty or missing)"""
+    if not has_journal(conn):
+        return 0
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM game_changes").fetchone()[0]
+
+def changes_since(conn, version, limit=None):
+    """Journal entries newer than a version, oldest first"""
+    query = """
+        SELECT version, game_id, game_date, changed_columns, final, changed_at
+        FROM game_changes WHERE version > ? ORDER BY version
+    """
+    params = [version]
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    return [
+        {
+            'version': row[0],
+            'game_id': row[1],
+            'game_date': row[2],
+            'columns': row[3].split(','),
+            'final': bool(row[4]),
+            'changed_at': row[5]
+        }
+        for row in conn.execute(query, params).fetchall()
+    ]
+
+def has_relevant_changes(conn, version, target_date):
+    """Whether any change since a version affects the page for target_date"""
+    row = conn.execute("""
+        SELECT 1 FROM game_changes
+        WHERE version > ? AND (final = 1 OR game_date = ?)
+        LIMIT 1
+    """, (version, target_date)).fetchone()
+    return row is not None
+
+def load_build_state(state_path):
+    """Build state saved by a renderer, or None"""
+    try:
+        with open(state_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_build_state(state_path, version, model_version, target_date=None):
+    """Remember the journal version an output was built from"""
+    state = {
+        'journal_version': version,
+        'model_version': model_version,
+        'date': target_date or datetime.now().strftime('%Y-%m-%d'),
+        'built_at': datetime.now().isoformat(timespec='seconds')
+    }
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+def needs_rebuild(conn, state_path, model_version, target_date=None):
+    """(rebuild?, current journal version) for an output and its build state"""
+    if target_date is None:
+        target_date = datetime.now().strftime('%Y-%m-%d')
+
+    # Without a journal there is no way to tell, so always rebuild
+    if not has_journal(conn):
+        return True, 0
+
+    version = current_version(conn)
+    state = load_build_state(state_path)
+    if (
+        state is None
+        or state.get('date') != target_date
+        or state.get('model_version') != model_version
+        or state.get('journal_version', 0) > version   # database was replaced
+    ):
+        return True, version
+
+    return has_relevant_changes(conn, state['journal_version'], target_date), version
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Cold-Start Check for MLB Predictor Dashboard
+
+Times fresh interpreter runs of `python main.py --help` and dashboard-only
+generation and compares the median against config.COLD_START_TARGETS.
+Wall-clock timings depend on the machine, so they only fail the run when
+asked to (--strict). The import check is deterministic and always gates:
+`main.py --help` must not load any module in config.COLD_START_LAZY_MODULES.
+
+    python cold_start.py [runs] [--strict]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import config
+
+# Runs main.py --help in-process and prints the modules it loaded
+HELP_IMPORTS_SCRIPT = """
+import sys
+sys.argv = ['main.py', '--help']
+try:
+    exec(compile(open('main.py', encoding='utf-8').read(), 'main.py', 'exec'), {'__name__': '__main__'})
+except SystemExit:
+    pass
+sys.stdout = sys.__stdout__
+print(' '.join(sorted(sys.modules)))
+"""
+
+def time_command(args, runs):
+    """Median wall time of a command over several fresh interpreter runs"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def help_imports():
+    """Modules loaded by a fresh `python main.py --help`"""
+    result = subprocess.run(
+        [sys.executable, '-c', HELP_IMPORTS_SCRIPT],
+        check=True, capture_output=True, text=True
+    )
+    return set(result.stdout.strip().splitlines()[-1].split())
+
+def main():
+    """Measure cold-start times and check --help's imports"""
+    args = sys.argv[1:]
+    strict = '--strict' in args
+    numbers = [arg for arg in args if arg.isdigit()]
+    runs = int(numbers[0]) if numbers else 5
+    output_path = os.path.join(tempfile.gettempdir(), 'mlb_cold_start_dashboard.html')
+
+    commands = {
+        'help': [sys.executable, 'main.py', '--help'],
+        'dashboard': [
+            sys.executable, '-c',
+            f"from dashboard import generate_dashboard; generate_dashboard({output_path!r}, open_browser=False, force=True)"
+        ]
+    }
+
+    print(f"Cold-start timings (median of {runs} runs)")
+    print("-" * 40)
+
+    failed = False
+    for name, command in commands.items():
+        elapsed = time_command(command, runs)
+        target = config.COLD_START_TARGETS[name]
+        status = "OK" if elapsed <= target else "SLOW"
+        failed = failed or (strict and elapsed > target)
+        print(f"{name:<10} {elapsed * 1000:7.0f} ms  (target {target * 1000:.0f} ms)  {status}")
+
+    eager = sorted(set(config.COLD_START_LAZY_MODULES) & help_imports())
+    if eager:
+        failed = True
+        print(f"main.py --help imports {', '.join(eager)} (expected to be deferred)")
+    else:
+        print(f"main.py --help defers {', '.join(config.COLD_START_LAZY_MODULES)}  OK")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
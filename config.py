@@ -5,6 +5,11 @@ Configuration settings for MLB Predictor Dashboard
 # Database Configuration
 DATABASE_PATH = 'mlb_data.db'
 
+# SQLite tuning (see db.py)
+SQLITE_CACHE_KIB = 65536            # Page cache per connection (64 MiB)
+SQLITE_MMAP_SIZE = 268435456        # Memory-mapped I/O window (256 MiB)
+SQLITE_BUSY_TIMEOUT_MS = 5000       # Wait this long for a competing writer
+
 # Prediction Configuration
 CONFIDENCE_THRESHOLDS = {
     'excellent': 0.15,  # High confidence threshold (15%)
@@ -13,14 +18,36 @@ CONFIDENCE_THRESHOLDS = {
     'poor': 0.08        # Lower threshold for more bets (8%)
 }
 
+# Prediction cache shared by main.py, dashboard.py and generate_static_site.py
+PREDICTION_CACHE_PATH = 'prediction_cache.db'
+PREDICTION_CACHE_DAYS = 7  # Entries older than this are evicted
+
+# Rendered page fragments reused by generate_static_site.py
+FRAGMENT_CACHE_PATH = 'fragment_cache.db'
+FRAGMENT_CACHE_DAYS = 3  # Rendered cards unused for this long are evicted
+
+# Journal version docs/ was last built from (kept next to the database, never published)
+SITE_BUILD_STATE_PATH = 'site_build_state.json'
+
 # Season Configuration
 CURRENT_SEASON = 2025
 MIN_PITCHER_GAMES = 3
+MIN_TEAM_GAMES = 10
+MIN_LEAGUE_GAMES = 100  # Final games before the season's own league YRFI rate is used
 
 # Dashboard Configuration
 DASHBOARD_TITLE = "⚾ MLB YRFI/NRFI Predictions Dashboard"
 AUTO_REFRESH_SECONDS = 300  # 5 minutes
 
+# Cold-start targets in seconds, reported by cold_start.py (enforced with --strict)
+COLD_START_TARGETS = {
+    'help': 0.15,       # python main.py --help
+    'dashboard': 0.75   # Dashboard-only generation with a warm prediction cache
+}
+
+# Heavy modules main.py --help must never import (checked by cold_start.py)
+COLD_START_LAZY_MODULES = ('numpy', 'pandas', 'predictor', 'dashboard')
+
 # HTML Dashboard Styling
 DASHBOARD_THEME = {
     'primary_color': '#1e3c72',
@@ -35,12 +62,63 @@ DASHBOARD_THEME = {
 BETTING_STRATEGY = {
     'min_confidence': 0.08,
     'max_daily_bets': 10,
-    'bankroll_percent': 0.02  # 2% of bankroll per bet
+    'bankroll_percent': 0.02,  # 2% of bankroll per bet
+    'american_odds': -110      # Assumed price for ROI in backtests and sweeps
+}
+
+# Game feed fetching (MLBDataFetcher.update_games)
+FETCH_CONFIG = {
+    'workers': 10,                  # Concurrent feed requests
+    'requests_per_second': 20,      # Token-bucket rate ceiling
+    'burst': 20,                    # Requests allowed back to back
+    'min_requests_per_second': 1,   # Floor when backing off after 429/5xx
+    'failure_threshold': 5          # Consecutive failures before the run stops
+}
+
+# Historical backfill (backfill.py)
+BACKFILL_CONFIG = {
+    'chunk_days': 7,                # Days per schedule request
+    'workers': 4,                   # Chunks fetched in parallel
+    'requests_per_second': 5,       # Rate budget for the whole backfill
+    'season_start': '03-15',        # Window searched in each season (MM-DD)
+    'season_end': '11-15',
+    'game_types': 'R'               # Regular season only
+}
+
+# Live first-inning tracker (fetch_mlb_data.py --live); intervals in seconds
+LIVE_CONFIG = {
+    'schedule_interval': 600,       # Slate refresh while no game is about to start
+    'pregame_interval': 60,         # Slate refresh when a game starts within pregame_window
+    'pregame_window': 900,
+    'in_progress_interval': 20,     # Linescore polls while a first inning is being played
+    'delayed_interval': 180,        # Linescore polls during delays and suspensions
+    'max_backoff': 300              # Cap for per-game error backoff
+}
+
+# Historical archive under docs/ (archive.py)
+ARCHIVE_CONFIG = {
+    'dir': 'archive',               # docs/archive/YYYY/MM-DD.json plus docs/archive/index.json
+    'regrade_days': 7,              # Dates with unfinished games are re-graded for this long
+    'void_statuses': ('Postponed', 'Cancelled')
+}
+
+# On-disk HTTP response cache (http_cache.py); TTLs are seconds per endpoint.
+# Final game feeds are cached forever regardless of the game_feed TTL; the
+# cache is cleared when the database's change-journal version does not match
+# the one it was saved with (delete the file to invalidate it by hand).
+HTTP_CACHE = {
+    'path': 'http_cache.db',
+    'max_bytes': 100 * 1024 * 1024,
+    'ttl': {
+        'schedule': 300,
+        'game_feed': 60
+    }
 }
 
 # API Configuration (if using external data sources)
 API_CONFIG = {
-    'base_url': 'https://api.mlb.com',
+    'base_url': 'https://statsapi.mlb.com/api/v1',
     'timeout': 30,
-    'retries': 3
+    'retries': 3,
+    'backoff_factor': 0.5           # Retry waits 0.5s, 1s, 2s, ...
 }
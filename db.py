@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite Connection Layer for MLB Predictor
+
+All database access goes through here so every component uses the same
+tuned settings:
+
+- Readers (predictor, renderers, analytics) get read-only connections
+  (mode=ro, query_only) with memory-mapped I/O and a larger page cache,
+  cached per thread so parallel scoring never shares a connection
+  (worker threads call close_thread_connections() when they finish).
+- The writer (fetcher) uses WAL journaling with synchronous=NORMAL, so
+  readers keep working while it writes and commits don't fsync the whole
+  database file.
+"""
+
+import os
+import sqlite3
+import threading
+import logging
+import config
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+def _apply_common_pragmas(conn):
+    """Settings shared by reader and writer connections"""
+    conn.execute(f"PRAGMA cache_size = -{int(config.SQLITE_CACHE_KIB)}")
+    conn.execute(f"PRAGMA mmap_size = {int(config.SQLITE_MMAP_SIZE)}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
+def connect_readonly(db_path=None):
+    """Open a new read-only connection tuned for aggregate queries"""
+    if db_path is None:
+        db_path = config.DATABASE_PATH
+
+    if not os.path.exists(db_path):
+        # Fail loudly rather than render an empty slate (mode=ro never creates the file)
+        raise FileNotFoundError(f"Database {db_path} not found")
+
+    uri = f"file:{os.path.abspath(db_path)}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, timeout=config.SQLITE_BUSY_TIMEOUT_MS / 1000)
+    _apply_common_pragmas(conn)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+def connect_writer(db_path=None, check_same_thread=True):
+    """Open a new writer connection in WAL mode"""
+    if db_path is None:
+        db_path = config.DATABASE_PATH
+
+    conn = sqlite3.connect(
+        db_path,
+        timeout=config.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=check_same_thread
+    )
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA busy_timeout = {int(config.SQLITE_BUSY_TIMEOUT_MS)}")
+    _apply_common_pragmas(conn)
+    return conn
+
+def get_connection(db_path=None, readonly=True):
+    """Return this thread's shared connection to a database, opening it on first use"""
+    if db_path is None:
+        db_path = config.DATABASE_PATH
+
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    key = (os.path.abspath(db_path), readonly)
+    conn = connections.get(key)
+    if conn is None:
+        conn = connect_readonly(db_path) if readonly else connect_writer(db_path)
+        connections[key] = conn
+    return conn
+
+def close_thread_connections():
+    """Close every connection opened by get_connection in this thread"""
+    connections = getattr(_local, 'connections', {})
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
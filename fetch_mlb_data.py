@@ -4,22 +4,100 @@ MLB Data Fetcher - Updates database with latest game data
 Fetches data from MLB Stats API or other sources
 """
 
-import requests
-import sqlite3
-import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import config
+import change_journal
+import db
+import prediction_store
+import season_stats
+import tracing
+from http_cache import HTTPCache, FOREVER
+from mlb_api import MLBApiClient
+from rate_limit import TokenBucket, CircuitBreaker
+import sys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Named schedule request profiles: the hydrations each job needs plus a
+# fields= filter (field names matched at any depth) that drops the rest
+_BASE_FIELDS = 'dates,date,games,gamePk,season,status,detailedState,teams,home,away,team,name,probablePitcher,fullName'
+REQUEST_PROFILES = {
+    # Today's slate: matchups, starters and status
+    'minimal': {
+        'hydrate': 'probablePitcher',
+        'fields': _BASE_FIELDS
+    },
+    # Results ingest: everything update_games stores, first inning included
+    'linescore': {
+        'hydrate': 'linescore,probablePitcher',
+        'fields': _BASE_FIELDS + ',linescore,innings,num,runs'
+    },
+    # Everything the schedule can hydrate (for exploration and comparisons)
+    'full': {
+        'hydrate': 'game(content(editorial(recap))),decisions,person,probablePitcher,stats,homeRuns,previousPlay,flags,review,broadcasts(all),venue,linescore,boxscore',
+        'fields': None
+    }
+}
+
+GAME_COLUMNS = (
+    'game_id', 'game_date', 'season', 'home_team_name', 'away_team_name',
+    'home_pitcher', 'away_pitcher', 'home_first_runs', 'away_first_runs',
+    'home_score', 'away_score', 'status'
+)
+
+# Columns written from today's slate (results are left untouched)
+SLATE_COLUMNS = (
+    'game_id', 'game_date', 'season', 'home_team_name', 'away_team_name',
+    'home_pitcher', 'away_pitcher', 'status'
+)
+
+# Slate columns for games already Final: the status is only ever written
+# together with the first-inning results (by update_games)
+SLATE_FINAL_COLUMNS = tuple(column for column in SLATE_COLUMNS if column != 'status')
+
+ID_CHUNK_SIZE = 500  # game_ids per IN (...) lookup
+
+# get_game_details(only_changed=True) result for a feed unchanged since the cached copy
+FEED_UNCHANGED = object()
+
 class MLBDataFetcher:
-    def __init__(self, db_path='mlb_data.db'):
+    def __init__(self, db_path='mlb_data.db', use_http_cache=True):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.base_url = "https://statsapi.mlb.com/api/v1"
+        # WAL writer so the dashboard and predictors can read while we write
+        self.conn = db.connect_writer(db_path)
+        
+        # Game feeds are fetched concurrently under a shared adaptive rate limit
+        fetch_config = config.FETCH_CONFIG
+        self.workers = fetch_config['workers']
+        self.rate_limiter = TokenBucket(
+            fetch_config['requests_per_second'],
+            burst=fetch_config['burst'],
+            min_rate=fetch_config['min_requests_per_second']
+        )
+        self.circuit_breaker = CircuitBreaker(fetch_config['failure_threshold'])
+        
+        # Conditional-request response cache shared across runs, emptied when
+        # the database is not the one it was last committed against
+        http_cache = None
+        if use_http_cache:
+            try:
+                http_cache = HTTPCache(source_version=change_journal.current_version(self.conn))
+            except Exception as e:
+                logger.warning(f"HTTP cache unavailable: {e}")
+        
+        # Pooled session with config.API_CONFIG timeout and retries
+        self.api = MLBApiClient(
+            pool_size=self.workers,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            cache=http_cache
+        )
+        self.base_url = self.api.base_url
         
     def create_tables(self):
         """Create database tables if they don't exist"""
@@ -43,6 +121,11 @@ class MLBDataFetcher:
             )
         """)
         
+        # Per-season pitcher/team/league aggregates maintained on every upsert
+        season_stats.create_season_stats_tables(self.conn)
+        change_journal.create_journal_table(self.conn)
+        prediction_store.create_predictions_table(self.conn)
+        
         self.conn.commit()
         logger.info("Database tables created/verified")
     
@@ -55,13 +138,12 @@ class MLBDataFetcher:
         params = {
             'sportId': 1,  # MLB
             'date': today,
-            'hydrate': 'team,probablePitcher'
+            **profile_params('minimal')
         }
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            with tracing.span('GET schedule (today)', 'http', url=url, date=today):
+                data = self.api.get_json('schedule:minimal', '/schedule', params)
             
             games = []
             if data.get('dates'):
@@ -100,31 +182,44 @@ class MLBDataFetcher:
         except Exception as e:
             logger.error(f"Error fetching today's games: {e}")
             return []
-        """Get MLB schedule for date range"""
+    
+    def get_schedule(self, start_date, end_date, profile='linescore', game_types=None):
+        """Get MLB schedule for date range using a request profile"""
         url = f"{self.base_url}/schedule"
         params = {
             'startDate': start_date,
             'endDate': end_date,
             'sportId': 1,  # MLB
-            'hydrate': 'game(content(editorial(recap))),decisions,person,probablePitcher,stats,homeRuns,previousPlay,flags,review,broadcasts(all),venue,linescore,boxscore'
+            **profile_params(profile)
         }
+        if game_types:
+            params['gameType'] = game_types  # e.g. 'R' for regular season only
         
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            with tracing.span(f'GET schedule ({profile})', 'http', url=url, start=start_date, end=end_date):
+                return self.api.get_json(f'schedule:{profile}', '/schedule', params)
         except Exception as e:
             logger.error(f"Error fetching schedule: {e}")
             return None
     
-    def get_game_details(self, game_id):
-        """Get detailed game information"""
+    def get_game_details(self, game_id, only_changed=False):
+        """Get detailed game information (safe to call from worker threads)
+
+        Returns None when the feed could not be fetched. With only_changed,
+        returns FEED_UNCHANGED when the feed is unchanged since the cached
+        copy, so callers can skip re-storing it.
+        """
         url = f"{self.base_url}/game/{game_id}/feed/live"
         
+        if self.circuit_breaker.is_open:
+            return None
+        
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            with tracing.span(f'GET game {game_id} feed/live', 'http', url=url):
+                if not only_changed:
+                    return self.api.get_json('game_feed', f"/game/{game_id}/feed/live", ttl=_game_feed_ttl)
+                game_details = self.api.get_json_if_changed('game_feed', f"/game/{game_id}/feed/live", ttl=_game_feed_ttl)
+                return FEED_UNCHANGED if game_details is None else game_details
         except Exception as e:
             logger.error(f"Error fetching game {game_id}: {e}")
             return None
@@ -196,7 +291,7 @@ class MLBDataFetcher:
             return "Unknown", "Unknown"
     
     def update_games(self, days_back=7):
-        """Update games for the last N days"""
+        """Update games for the last N days; returns rows written"""
         self.create_tables()
         
         end_date = datetime.now()
@@ -210,108 +305,360 @@ class MLBDataFetcher:
         schedule_data = self.get_schedule(start_str, end_str)
         if not schedule_data:
             logger.error("Failed to fetch schedule")
-            return
+            return 0
         
-        games_updated = 0
-        cursor = self.conn.cursor()
+        games_updated, missing = self.ingest_schedule(schedule_data)
+        self.commit_cache()
+        logger.info(f"✅ Updated {games_updated} games")
+        if missing:
+            logger.warning(f"{len(missing)} game feeds could not be fetched; they will be retried next run")
+        return games_updated
+    
+    def store_slate(self, games):
+        """Upsert slate rows (SLATE_COLUMNS) without marking any game Final
+        
+        A Final status written without first-inning runs would make the
+        game count as an NRFI and stop update_games from fetching its
+        results, so Final games keep their stored status here.
+        """
+        pending = [game for game in games if game['status'] != 'Final']
+        final = [game for game in games if game['status'] == 'Final']
+        return (self.store_games(pending, columns=SLATE_COLUMNS)
+                + self.store_games(final, columns=SLATE_FINAL_COLUMNS))
+    
+    def ingest_schedule(self, schedule_data):
+        """Store every not-yet-final game of a schedule document
         
-        for date_data in schedule_data.get('dates', []):
-            game_date = date_data.get('date')
+        Returns (rows written, ids of games whose feed could not be fetched
+        and so were not stored).
+        """
+        # One lookup for every scheduled game; final games are skipped in memory
+        schedule_games = [
+            (date_data.get('date'), game)
+            for date_data in schedule_data.get('dates', [])
+            for game in date_data.get('games', [])
+        ]
+        stored = self.load_stored_games([game.get('gamePk') for _, game in schedule_games])
+        
+        # Build rows straight from the schedule; only games it can't fully
+        # describe need their feed/live document
+        rows = []
+        fallback = []
+        for game_date, game in schedule_games:
+            game_id = str(game.get('gamePk'))
+            existing = stored.get(game_id)
             
-            for game in date_data.get('games', []):
-                game_id = game.get('gamePk')
-                
-                # Check if game already exists and is final
-                cursor.execute("SELECT status FROM games WHERE game_id = ?", (game_id,))
-                existing = cursor.fetchone()
-                
-                if existing and existing[0] == 'Final':
-                    continue  # Skip already completed games
-                
-                # Get detailed game data
-                game_details = self.get_game_details(game_id)
-                if not game_details:
-                    continue
-                
-                # Extract game information
-                game_data = game_details.get('gameData', {})
-                live_data = game_details.get('liveData', {})
-                
-                teams = game_data.get('teams', {})
-                home_team = teams.get('home', {}).get('name', 'Unknown')
-                away_team = teams.get('away', {}).get('name', 'Unknown')
-                
-                status = game_details.get('gameData', {}).get('status', {}).get('detailedState', 'Unknown')
-                season = game_data.get('game', {}).get('season', datetime.now().year)
-                
-                # Get pitchers
-                home_pitcher, away_pitcher = self.get_probable_pitchers(game_details)
+            if is_complete(existing):
+                continue  # Skip already completed games
+            
+            row = self.game_row_from_schedule(game, game_date)
+            if row is None:
+                fallback.append((game_id, game_date, existing))
+            else:
+                rows.append(row)
+        
+        missing = []
+        if fallback:
+            logger.info(f"Fetching {len(fallback)} game feeds with {self.workers} workers (incomplete schedule data)")
+            feed_rows, missing = self._rows_from_feeds(fallback)
+            rows.extend(feed_rows)
+        
+        return self.store_games(rows, stored=stored), missing
+    
+    def _rows_from_feeds(self, pending):
+        """Fetch feed/live for (game_id, game_date, existing) entries
+        
+        Returns (rows, ids of games that failed or were never fetched).
+        """
+        # Workers only fetch; rows are written later by the single writer
+        rows = []
+        fetched = set()
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = {
+                # Unchanged feeds of games we already store need no write
+                pool.submit(self.get_game_details, game_id, existing is not None): (game_id, game_date)
+                for game_id, game_date, existing in pending
+            }
+            
+            for future in as_completed(futures):
+                game_details = future.result()
+                game_id, game_date = futures[future]
+                if game_details is FEED_UNCHANGED:
+                    fetched.add(game_id)
+                elif game_details:
+                    rows.append(self.game_row_from_feed(game_id, game_date, game_details))
+                    fetched.add(game_id)
                 
-                # Get first inning runs (only for completed games)
-                home_first_runs, away_first_runs = 0, 0
-                home_score, away_score = 0, 0
+                if self.circuit_breaker.is_open:
+                    logger.error("Stopping update: too many consecutive API failures")
+                    break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        missing = [game_id for game_id, _, _ in pending if game_id not in fetched]
+        return rows, missing
+    
+    def load_stored_games(self, game_ids):
+        """Stored games rows for the given ids, keyed by game_id as a string"""
+        ids = list({str(game_id) for game_id in game_ids})
+        stored = {}
+        cursor = self.conn.cursor()
+        for i in range(0, len(ids), ID_CHUNK_SIZE):
+            chunk = ids[i:i + ID_CHUNK_SIZE]
+            cursor.execute(
+                f"SELECT {', '.join(GAME_COLUMNS)} FROM games WHERE game_id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            for values in cursor.fetchall():
+                row = dict(zip(GAME_COLUMNS, values))
+                row['game_id'] = str(row['game_id'])
+                stored[row['game_id']] = row
+        return stored
+    
+    def game_row_from_schedule(self, game, game_date):
+        """Build a games row from a schedule entry (linescore and probablePitcher hydrated)
+        
+        Returns None for final games missing their first inning or a starter,
+        which are left to the feed/live fallback.
+        """
+        teams = game.get('teams', {})
+        home = teams.get('home', {})
+        away = teams.get('away', {})
+        status = game.get('status', {}).get('detailedState', 'Unknown')
+        
+        row = {
+            'game_id': str(game['gamePk']),
+            'game_date': game_date,
+            'season': int(game.get('season') or datetime.now().year),
+            'home_team_name': home.get('team', {}).get('name', 'Unknown'),
+            'away_team_name': away.get('team', {}).get('name', 'Unknown'),
+            'home_pitcher': home.get('probablePitcher', {}).get('fullName', 'Unknown'),
+            'away_pitcher': away.get('probablePitcher', {}).get('fullName', 'Unknown'),
+            'home_first_runs': 0,
+            'away_first_runs': 0,
+            'home_score': 0,
+            'away_score': 0,
+            'status': status
+        }
+        
+        # First inning runs and scores only for completed games
+        if status == 'Final':
+            linescore = game.get('linescore', {})
+            innings = linescore.get('innings', [])
+            if not innings or 'Unknown' in (row['home_pitcher'], row['away_pitcher']):
+                return None
+            
+            row['home_first_runs'] = innings[0].get('home', {}).get('runs', 0)
+            row['away_first_runs'] = innings[0].get('away', {}).get('runs', 0)
+            row['home_score'] = linescore.get('teams', {}).get('home', {}).get('runs', 0)
+            row['away_score'] = linescore.get('teams', {}).get('away', {}).get('runs', 0)
+        
+        return row
+    
+    def game_row_from_feed(self, game_id, game_date, game_details):
+        """Build a games row from a feed/live document"""
+        # Extract game information
+        game_data = game_details.get('gameData', {})
+        live_data = game_details.get('liveData', {})
+        
+        teams = game_data.get('teams', {})
+        home_team = teams.get('home', {}).get('name', 'Unknown')
+        away_team = teams.get('away', {}).get('name', 'Unknown')
+        
+        status = game_details.get('gameData', {}).get('status', {}).get('detailedState', 'Unknown')
+        season = game_data.get('game', {}).get('season', datetime.now().year)
+        
+        # Get pitchers
+        home_pitcher, away_pitcher = self.get_probable_pitchers(game_details)
+        
+        # Get first inning runs (only for completed games)
+        home_first_runs, away_first_runs = 0, 0
+        home_score, away_score = 0, 0
+        
+        if status == 'Final':
+            home_first_runs, away_first_runs = self.extract_first_inning_runs(game_details)
+            
+            # Get final scores
+            linescore = live_data.get('linescore', {})
+            teams_score = linescore.get('teams', {})
+            home_score = teams_score.get('home', {}).get('runs', 0)
+            away_score = teams_score.get('away', {}).get('runs', 0)
+        
+        return {
+            'game_id': str(game_id),
+            'game_date': game_date,
+            'season': int(season),
+            'home_team_name': home_team,
+            'away_team_name': away_team,
+            'home_pitcher': home_pitcher,
+            'away_pitcher': away_pitcher,
+            'home_first_runs': home_first_runs,
+            'away_first_runs': away_first_runs,
+            'home_score': home_score,
+            'away_score': away_score,
+            'status': status
+        }
+    
+    def store_games(self, rows, columns=GAME_COLUMNS, stored=None):
+        """Upsert games rows in one transaction and update the season aggregates
+        
+        Only ``columns`` are written: existing rows keep created_at and any
+        other column, and rows identical to what is stored are skipped.
+        Every written row is also recorded in the game_changes journal, and
+        stored predictions of games now Final are graded.
+        ``stored`` is the load_stored_games() result when the caller has it.
+        Returns the number of rows written.
+        """
+        if stored is None:
+            stored = self.load_stored_games(row['game_id'] for row in rows)
+        # Rows are diffed against what the batch has written so far, so a game
+        # listed twice (suspended and resumed games appear under both dates)
+        # moves the aggregates once
+        stored = dict(stored)
+        
+        changes = []
+        for row in rows:
+            row = {column: row[column] for column in columns}
+            row['game_id'] = str(row['game_id'])
+            existing = stored.get(row['game_id'])
+            changed_columns = [
+                column for column in columns
+                if column != 'game_id' and (existing is None or existing[column] != row[column])
+            ]
+            if not changed_columns:
+                continue
+            merged = {**dict.fromkeys(GAME_COLUMNS), **(existing or {}), **row}
+            changes.append((row, existing, merged, changed_columns))
+            stored[row['game_id']] = merged
+        
+        if not changes:
+            return 0
+        
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns if column != 'game_id')
+        with tracing.span('upsert games', 'sql', games=len(changes)):
+            # Commits on success, rolls back everything on error
+            with self.conn:
+                cursor = self.conn.cursor()
+                if not self.conn.in_transaction:
+                    cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(f"""
+                    INSERT INTO games ({', '.join(columns)})
+                    VALUES ({', '.join('?' * len(columns))})
+                    ON CONFLICT(game_id) DO UPDATE SET {updates}
+                """, [tuple(row[column] for column in columns) for row, _, _, _ in changes])
                 
-                if status == 'Final':
-                    home_first_runs, away_first_runs = self.extract_first_inning_runs(game_details)
-                    
-                    # Get final scores
-                    linescore = live_data.get('linescore', {})
-                    teams_score = linescore.get('teams', {})
-                    home_score = teams_score.get('home', {}).get('runs', 0)
-                    away_score = teams_score.get('away', {}).get('runs', 0)
+                for row, existing, merged, _ in changes:
+                    old = {column: existing[column] for column in season_stats.GAME_STAT_COLUMNS} if existing else None
+                    new = {column: merged[column] for column in season_stats.GAME_STAT_COLUMNS}
+                    season_stats.apply_game_change(cursor, old, new)
                 
-                # Insert or update game
-                cursor.execute("""
-                    INSERT OR REPLACE INTO games 
-                    (game_id, game_date, season, home_team_name, away_team_name, 
-                     home_pitcher, away_pitcher, home_first_runs, away_first_runs,
-                     home_score, away_score, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    game_id, game_date, season, home_team, away_team,
-                    home_pitcher, away_pitcher, home_first_runs, away_first_runs,
-                    home_score, away_score, status
-                ))                
-                games_updated += 1
-                logger.info(f"Updated: {away_team} @ {home_team} ({game_date}) - Status: {status}")
+                # Journal entries commit (or roll back) together with the rows
+                change_journal.record_changes(cursor, [
+                    (
+                        row['game_id'], merged['game_date'], changed_columns,
+                        merged['status'] == 'Final' or (existing and existing['status'] == 'Final')
+                    )
+                    for row, existing, merged, changed_columns in changes
+                ])
                 
-                # Rate limiting
-                time.sleep(0.1)
+                # Stored predictions are graded as soon as their game goes Final
+                prediction_store.grade_games(cursor, [
+                    (row['game_id'], merged['status'], merged['home_first_runs'], merged['away_first_runs'])
+                    for row, _, merged, _ in changes
+                    if merged['status'] == 'Final'
+                ])
         
-        self.conn.commit()
-        logger.info(f"✅ Updated {games_updated} games")
+        for row, _, merged, _ in changes:
+            logger.info(f"Updated: {merged['away_team_name']} @ {merged['home_team_name']} ({merged['game_date']}) - Status: {merged['status']}")
+        return len(changes)
+    
+    def profile_report(self, start_date, end_date):
+        """Download one schedule range with every request profile and compare size and parse time"""
+        results = []
+        for profile in REQUEST_PROFILES:
+            params = {'startDate': start_date, 'endDate': end_date, 'sportId': 1, **profile_params(profile)}
+            response = self.api.get(f'schedule:{profile}', '/schedule', params)
+            start = time.perf_counter()
+            data = json.loads(response.content)
+            parse_seconds = time.perf_counter() - start
+            games = sum(len(d.get('games', [])) for d in data.get('dates', []))
+            results.append((profile, len(response.content), parse_seconds, games))
+        
+        full_bytes = results[-1][1] or 1
+        print(f"\n📦 Schedule payload by profile ({start_date} to {end_date})")
+        print("-" * 60)
+        for profile, size, parse_seconds, games in results:
+            print(f"{profile:<10} {size / 1024:10.1f} KB  {size / full_bytes:6.1%}  "
+                  f"parse {parse_seconds * 1000:7.1f} ms  {games} games")
+        return results
+    
+    def commit_cache(self):
+        """Persist this run's HTTP cache entries against the database's current version"""
+        self.api.commit_cache(change_journal.current_version(self.conn))
     
     def close(self):
-        """Close database connection"""
+        """Close database and HTTP connections"""
         self.conn.close()
+        self.api.close()
+
+def is_complete(row):
+    """Whether a stored games row is Final with its first-inning runs"""
+    return (
+        row is not None and row['status'] == 'Final'
+        and row['home_first_runs'] is not None and row['away_first_runs'] is not None
+    )
+
+def profile_params(profile):
+    """hydrate / fields query parameters for a named request profile"""
+    settings = REQUEST_PROFILES[profile]
+    return {key: value for key, value in settings.items() if value}
+
+def _game_feed_ttl(game_details):
+    """Cache final game feeds forever and live/scheduled ones briefly"""
+    status = game_details.get('gameData', {}).get('status', {}).get('detailedState')
+    if status == 'Final':
+        return FOREVER
+    return config.HTTP_CACHE['ttl']['game_feed']
 
 def main():
     """Main function to fetch TODAY'S real MLB data"""
+    args = tracing.enable_from_argv(sys.argv[1:])
+    
+    # python fetch_mlb_data.py --profile-report [days]
+    if args and args[0] == '--profile-report':
+        days = int(args[1]) if len(args) > 1 else 7
+        fetcher = MLBDataFetcher(use_http_cache=False)
+        end_date = datetime.now()
+        fetcher.profile_report((end_date - timedelta(days=days)).strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        fetcher.close()
+        return
+    
+    # python fetch_mlb_data.py --live [--publish "shell command"] [--max-minutes N]
+    if args and args[0] == '--live':
+        from live_tracker import run_live
+        publish_command = args[args.index('--publish') + 1] if '--publish' in args else None
+        max_minutes = float(args[args.index('--max-minutes') + 1]) if '--max-minutes' in args else None
+        fetcher = MLBDataFetcher()
+        run_live(fetcher, publish_command, max_minutes)
+        fetcher.close()
+        return
+    
     print("Fetching TODAY'S Real MLB Games...")
     
     fetcher = MLBDataFetcher()
-    fetcher.create_tables()
+    with tracing.span('create tables', 'sql'):
+        fetcher.create_tables()
     
     # Get today's games
-    games = fetcher.get_today_games()
+    with tracing.span('fetch today\'s games', 'stage'):
+        games = fetcher.get_today_games()
     
     if games:
         # Store games in database
-        cursor = fetcher.conn.cursor()
-        
-        for game in games:
-            # Insert or update game data
-            cursor.execute("""
-                INSERT OR REPLACE INTO games (
-                    game_id, game_date, season, home_team_name, away_team_name,
-                    home_pitcher, away_pitcher, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                game['game_id'], game['game_date'], game['season'],
-                game['home_team_name'], game['away_team_name'],
-                game['home_pitcher'], game['away_pitcher'], game['status']            ))
-        
-        fetcher.conn.commit()
+        with tracing.span('store games', 'stage', games=len(games)):
+            fetcher.store_slate(games)
+            fetcher.commit_cache()
         print(f"Stored {len(games)} real games in database")
         
         # Show what we got
@@ -324,7 +671,12 @@ def main():
     else:
         print("No games found for today")
     
-    fetcher.conn.close()
+    # Final results (first inning included) for yesterday's and today's games
+    with tracing.span('update recent results', 'stage'):
+        fetcher.update_games(days_back=1)
+    
+    fetcher.api.print_stats()
+    fetcher.close()
     print("Database updated with real MLB data!")
 
 if __name__ == "__main__":
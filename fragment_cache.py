@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Rendered Fragment Cache for the Static Site
+
+Keeps each rendered prediction card in a sidecar SQLite file, keyed by a
+hash of the card's inputs (template version, position, prediction
+fields), so a rebuild re-renders only the cards whose prediction changed
+and stitches the rest from cache. It also remembers the key each page was
+last built from, letting generate_static_site.py leave a page (and its
+timestamp) untouched when nothing on it changed.
+"""
+
+import hashlib
+import json
+import logging
+import config
+import db
+
+logger = logging.getLogger(__name__)
+
+def fragment_key(*parts):
+    """Stable hash of a fragment's inputs"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+class FragmentCache:
+    def __init__(self, cache_path=None, max_age_days=None):
+        if cache_path is None:
+            cache_path = config.FRAGMENT_CACHE_PATH
+        if max_age_days is None:
+            max_age_days = config.FRAGMENT_CACHE_DAYS
+        self.cache_path = cache_path
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self.pending = {}
+        self.used = set()
+
+        self.conn = db.connect_writer(cache_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS fragments (
+                key TEXT PRIMARY KEY,
+                html TEXT NOT NULL,
+                last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                path TEXT PRIMARY KEY,
+                key TEXT NOT NULL,
+                built_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self.conn.commit()
+
+    def fragment(self, key, render):
+        """Cached HTML for a key, calling render() (a fragment iterable) on a miss"""
+        if key in self.pending:
+            self.hits += 1
+            return self.pending[key]
+
+        row = self.conn.execute("SELECT html FROM fragments WHERE key = ?", (key,)).fetchone()
+        if row:
+            self.hits += 1
+            self.used.add(key)
+            return row[0]
+
+        self.misses += 1
+        html = ''.join(render())
+        self.pending[key] = html
+        return html
+
+    def page_key(self, path):
+        """Key a page was last built from, or None"""
+        row = self.conn.execute("SELECT key FROM pages WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    def commit(self, path=None, page_key=None):
+        """Persist new fragments (and a page's key), refresh usage and evict stale entries"""
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO fragments (key, html) VALUES (?, ?)",
+                    list(self.pending.items())
+                )
+                self.conn.executemany(
+                    "UPDATE fragments SET last_used = CURRENT_TIMESTAMP WHERE key = ?",
+                    [(key,) for key in self.used]
+                )
+                if path is not None:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO pages (path, key) VALUES (?, ?)", (path, page_key)
+                    )
+                self.conn.execute(
+                    "DELETE FROM fragments WHERE last_used < datetime('now', ?)",
+                    (f'-{int(self.max_age_days)} days',)
+                )
+            self.pending.clear()
+            self.used.clear()
+        except Exception as e:
+            logger.warning(f"Error writing fragment cache: {e}")
+
+    def clear(self):
+        """Remove every cached fragment and page key"""
+        self.conn.execute("DELETE FROM fragments")
+        self.conn.execute("DELETE FROM pages")
+        self.conn.commit()
+
+    def close(self):
+        """Close cache connection"""
+        self.conn.close()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+On-Disk HTTP Response Cache for MLB Stats API Calls
+
+Stores response bodies with their ETag / Last-Modified validators so
+MLBApiClient can serve fresh entries without a request and revalidate
+stale ones with conditional requests (a 304 costs no download and no
+parsing). Each entry carries its own TTL, chosen per endpoint by the
+caller, and the file is kept under a size budget by evicting the least
+recently used entries.
+
+Writes are buffered until commit() so callers can persist them only after
+their own database transaction succeeds; a crashed run then re-fetches
+instead of trusting a cache entry whose data was never stored.
+
+The cache is keyed to the database it feeds: commit() records the
+database's change-journal version and opening the cache with a different
+version (a database restored from git behind or ahead of the cache)
+empties it, so cached "unchanged" answers never hide data the database
+lacks. Deleting the cache file is always safe; the next run re-fetches.
+"""
+
+import threading
+import time
+import logging
+import config
+import db
+
+logger = logging.getLogger(__name__)
+
+FOREVER = 10 * 365 * 24 * 3600  # TTL for documents that never change again
+
+class CacheEntry:
+    """A cached response body and its validators"""
+
+    def __init__(self, key, body, etag, last_modified, ttl, expires_at):
+        self.key = key
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.ttl = ttl
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self):
+        """Whether the entry can be used without revalidating"""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self):
+        """Headers that make a request conditional on this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class HTTPCache:
+    def __init__(self, cache_path=None, max_bytes=None, source_version=None):
+        if cache_path is None:
+            cache_path = config.HTTP_CACHE['path']
+        if max_bytes is None:
+            max_bytes = config.HTTP_CACHE['max_bytes']
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        # Shared by fetch worker threads, so access is serialized by a lock
+        self.lock = threading.Lock()
+        self.conn = db.connect_writer(cache_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                ttl REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_last_used ON http_cache(last_used)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS http_cache_meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.commit()
+        self.pending = {}
+        self.touched = {}
+
+        cached_version = self.source_version()
+        if source_version is not None and cached_version != str(source_version):
+            if cached_version is not None:
+                logger.info(f"HTTP cache was saved with database version {cached_version}, not {source_version}; clearing it")
+            self.clear()
+            self._record_source_version(source_version)
+            self.conn.commit()
+
+    def source_version(self):
+        """Database version the cached entries were committed against, or None"""
+        row = self.conn.execute("SELECT value FROM http_cache_meta WHERE key = 'source_version'").fetchone()
+        return row[0] if row else None
+
+    def _record_source_version(self, source_version):
+        """Store the database version (committed by the caller)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO http_cache_meta (key, value) VALUES ('source_version', ?)",
+            (str(source_version),)
+        )
+
+    def get(self, url):
+        """Return the cached entry for a URL, or None"""
+        with self.lock:
+            if url in self.pending:
+                return self.pending[url][1]
+            try:
+                row = self.conn.execute("""
+                    SELECT body, etag, last_modified, ttl, expires_at FROM http_cache WHERE url = ?
+                """, (url,)).fetchone()
+            except Exception as e:
+                logger.warning(f"Error reading HTTP cache: {e}")
+                return None
+            if row is None:
+                return None
+            self.touched[url] = time.time()
+            return CacheEntry(url, bytes(row[0]), row[1], row[2], row[3], row[4])
+
+    def put(self, url, endpoint, body, etag, last_modified, ttl):
+        """Buffer a new or updated response until commit()"""
+        entry = CacheEntry(url, body, etag, last_modified, ttl, time.time() + ttl)
+        with self.lock:
+            self.pending[url] = (endpoint, entry)
+        return entry
+
+    def refresh(self, url, endpoint, entry):
+        """Extend an entry's lifetime after a 304 Not Modified"""
+        return self.put(url, endpoint, entry.body, entry.etag, entry.last_modified, entry.ttl)
+
+    def commit(self, source_version=None):
+        """Persist buffered entries and access times, then enforce the size budget
+
+        ``source_version`` is the database version the entries' data was
+        stored at, recorded with them in the same transaction.
+        """
+        with self.lock:
+            now = time.time()
+            try:
+                self.conn.executemany("""
+                    INSERT OR REPLACE INTO http_cache
+                    (url, endpoint, body, etag, last_modified, ttl, expires_at, last_used, size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (url, endpoint, entry.body, entry.etag, entry.last_modified,
+                     entry.ttl, entry.expires_at, now, len(entry.body))
+                    for url, (endpoint, entry) in self.pending.items()
+                ])
+                self.conn.executemany(
+                    "UPDATE http_cache SET last_used = ? WHERE url = ?",
+                    [(used, url) for url, used in self.touched.items() if url not in self.pending]
+                )
+                self.evict()
+                if source_version is not None:
+                    self._record_source_version(source_version)
+                self.conn.commit()
+            except Exception as e:
+                logger.warning(f"Error writing HTTP cache: {e}")
+            self.pending.clear()
+            self.touched.clear()
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits its size budget"""
+        total = self.conn.execute("SELECT TOTAL(size) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        freed = 0
+        doomed = []
+        for url, size in self.conn.execute("SELECT url, size FROM http_cache ORDER BY last_used"):
+            doomed.append((url,))
+            freed += size
+            if freed >= excess:
+                break
+        self.conn.executemany("DELETE FROM http_cache WHERE url = ?", doomed)
+        logger.info(f"HTTP cache evicted {len(doomed)} entries ({freed / 1e6:.1f} MB)")
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self.lock:
+            self.pending.clear()
+            self.touched.clear()
+            self.conn.execute("DELETE FROM http_cache")
+            self.conn.commit()
+
+    def close(self):
+        """Close cache connection (uncommitted entries are discarded)"""
+        self.conn.close()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Live First-Inning Tracker for MLB Predictor
+
+Long-running mode of the fetcher (python fetch_mlb_data.py --live) that
+keeps one warm API session and database connection for the whole game day.
+It refreshes today's slate periodically, polls the lightweight
+/game/{id}/linescore endpoint only for games in progress, and stops
+tracking a game as soon as its first inning is decided. Rows are written
+only when they change and the site is re-rendered only when a first-inning
+outcome changes. Before exiting it stores the day's final results with
+update_games, so season stats, grading and the archive see them. Polling intervals follow game state (see
+config.LIVE_CONFIG) and back off on errors.
+"""
+
+import subprocess
+import time
+from datetime import datetime, timezone
+import logging
+import config
+import tracing
+from fetch_mlb_data import profile_params, SLATE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Columns the tracker writes for a game in progress
+LIVE_COLUMNS = ('game_id', 'status', 'home_first_runs', 'away_first_runs')
+
+class TrackedGame:
+    """Polling state for one of today's games"""
+
+    def __init__(self, game_id, start_time):
+        self.game_id = game_id
+        self.start_time = start_time
+        self.state = 'Preview'
+        self.status = None
+        self.outcome = None       # 'YRFI' / 'NRFI' once decided
+        self.done = False
+        self.next_poll = 0.0
+        self.errors = 0
+
+def first_inning_state(linescore):
+    """(home runs, away runs, complete) for the first inning of a linescore"""
+    innings = linescore.get('innings', [])
+    if not innings:
+        return 0, 0, False
+
+    first = innings[0]
+    home_runs = first.get('home', {}).get('runs', 0) or 0
+    away_runs = first.get('away', {}).get('runs', 0) or 0
+
+    # Complete once play has moved past the first inning
+    complete = (
+        len(innings) > 1
+        or linescore.get('currentInning', 1) > 1
+        or (linescore.get('inningHalf') == 'Bottom' and linescore.get('inningState') == 'End')
+    )
+    return home_runs, away_runs, complete
+
+def first_inning_outcome(home_runs, away_runs, complete):
+    """YRFI as soon as anyone scores, NRFI once a scoreless inning ends"""
+    if home_runs + away_runs > 0:
+        return 'YRFI'
+    if complete:
+        return 'NRFI'
+    return None
+
+def render_site():
+    """Regenerate the static site in-process"""
+    import generate_static_site
+    generate_static_site.main()
+
+class LiveTracker:
+    def __init__(self, fetcher, on_outcome_change=render_site, publish_command=None):
+        self.fetcher = fetcher
+        self.api = fetcher.api
+        self.on_outcome_change = on_outcome_change
+        self.publish_command = publish_command
+        self.settings = config.LIVE_CONFIG
+        self.games = {}
+        self.schedule_loaded = False
+        self.next_schedule_refresh = 0.0
+
+    def refresh_schedule(self):
+        """Update today's slate and each game's state from the schedule; False on failure"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        params = {'sportId': 1, 'date': today, **profile_params('minimal')}
+        params['fields'] += ',gameDate,abstractGameState'
+
+        try:
+            with tracing.span('GET schedule (live)', 'http', date=today):
+                data = self.api.get_json('schedule:minimal', '/schedule', params, ttl=0)
+        except Exception as e:
+            logger.error(f"Error refreshing schedule: {e}")
+            return False
+
+        rows = []
+        for date_info in data.get('dates', []):
+            for game in date_info.get('games', []):
+                game_id = str(game['gamePk'])
+                tracked = self.games.get(game_id)
+                if tracked is None:
+                    start = datetime.fromisoformat(game['gameDate'].replace('Z', '+00:00')).timestamp()
+                    tracked = self.games[game_id] = TrackedGame(game_id, start)
+
+                tracked.state = game.get('status', {}).get('abstractGameState', 'Preview')
+                tracked.status = game.get('status', {}).get('detailedState')
+                if tracked.state == 'Final':
+                    tracked.done = True  # Final rows are stored by update_games when run_live ends
+
+                # Final games have no linescore in this profile; their row is left alone
+                row = self.fetcher.game_row_from_schedule(game, today)
+                if row is not None:
+                    rows.append({column: row[column] for column in SLATE_COLUMNS})
+
+        if rows:
+            self.fetcher.store_slate(rows)
+        self.schedule_loaded = True
+        return True
+
+    def poll_interval(self, game):
+        """Seconds until a game should be polled again, based on its state"""
+        if game.errors:
+            return min(self.settings['max_backoff'], self.settings['in_progress_interval'] * 2 ** game.errors)
+        if 'Delay' in (game.status or '') or 'Suspended' in (game.status or ''):
+            return self.settings['delayed_interval']
+        return self.settings['in_progress_interval']
+
+    def poll_game(self, game):
+        """Fetch a live game's linescore; returns True when its outcome changed"""
+        try:
+            with tracing.span(f'GET game {game.game_id} linescore', 'http'):
+                linescore = self.api.get_json('linescore', f"/game/{game.game_id}/linescore", ttl=0)
+        except Exception as e:
+            game.errors += 1
+            logger.warning(f"Error polling game {game.game_id}: {e}")
+            return False
+        game.errors = 0
+
+        home_runs, away_runs, complete = first_inning_state(linescore)
+        self.fetcher.store_games([{
+            'game_id': game.game_id,
+            'status': game.status,
+            'home_first_runs': home_runs,
+            'away_first_runs': away_runs
+        }], columns=LIVE_COLUMNS)
+
+        if complete:
+            game.done = True
+            logger.info(f"Game {game.game_id}: first inning complete ({away_runs}-{home_runs}), no longer tracked")
+
+        outcome = first_inning_outcome(home_runs, away_runs, complete)
+        if outcome != game.outcome:
+            game.outcome = outcome
+            logger.info(f"Game {game.game_id}: first inning outcome {outcome}")
+            return True
+        return False
+
+    def publish(self):
+        """Re-render (and optionally publish) after an outcome change"""
+        if self.on_outcome_change:
+            with tracing.span('re-render', 'stage'):
+                self.on_outcome_change()
+        # Fold the WAL (rendering's prediction writes included) into the main
+        # file so the published mlb_data.db is complete on its own
+        self.fetcher.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        if self.publish_command:
+            subprocess.run(self.publish_command, shell=True, check=False)
+
+    def schedule_interval(self, now):
+        """Seconds until the slate should be refreshed"""
+        if not self.schedule_loaded:
+            return self.settings['pregame_interval']
+        upcoming = [g.start_time for g in self.games.values() if g.state == 'Preview']
+        if any(start - now < self.settings['pregame_window'] for start in upcoming):
+            return self.settings['pregame_interval']
+        return self.settings['schedule_interval']
+
+    def run(self, max_cycles=None, deadline=None):
+        """Track today's games until every first inning is decided or ``deadline`` (epoch seconds) passes"""
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            cycles += 1
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                logger.info("Reached the run's time limit, stopping (the next run picks up remaining games)")
+                break
+
+            if now >= self.next_schedule_refresh:
+                if self.refresh_schedule() and not self.games:
+                    logger.info("No games today, stopping")
+                    break
+                self.next_schedule_refresh = now + self.schedule_interval(now)
+
+            changed = False
+            for game in self.games.values():
+                if game.done or game.state != 'Live' or game.next_poll > now:
+                    continue
+                changed = self.poll_game(game) or changed
+                game.next_poll = time.time() + self.poll_interval(game)
+            self.fetcher.commit_cache()
+
+            if changed:
+                self.publish()
+
+            if self.games and all(g.done for g in self.games.values()):
+                logger.info("Every first inning of the day is decided, stopping")
+                break
+
+            wake = min([self.next_schedule_refresh] + [
+                g.next_poll for g in self.games.values() if g.state == 'Live' and not g.done
+            ])
+            if deadline is not None:
+                wake = min(wake, deadline)
+            time.sleep(max(1.0, wake - time.time()))
+        return cycles
+
+def run_live(fetcher, publish_command=None, max_minutes=None):
+    """Run the tracker from fetch_mlb_data.py --live, for at most ``max_minutes``"""
+    fetcher.create_tables()
+    tracker = LiveTracker(fetcher, publish_command=publish_command)
+    print(f"📺 Tracking today's first innings (started {datetime.now(timezone.utc):%H:%M} UTC)...")
+    tracker.run(deadline=time.time() + max_minutes * 60 if max_minutes else None)
+    
+    # Games finish long after their first inning: store final results before exiting
+    with tracing.span('update recent results', 'stage'):
+        if fetcher.update_games(days_back=1):
+            tracker.publish()
+    fetcher.api.print_stats()
+    return tracker
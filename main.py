@@ -8,9 +8,8 @@ This is the primary script to run daily predictions and generate dashboard.
 import sys
 import os
 from datetime import datetime
-from predictor import MLBPredictor
-from dashboard import generate_dashboard
 import config
+import tracing
 
 def setup_database():
     """Create or verify database structure"""
@@ -36,12 +35,17 @@ def run_daily_predictions():
         return False
     
     try:
+        # Heavy imports (numpy, predictor) are deferred so --help starts instantly
+        from predictor import MLBPredictor
+        from dashboard import generate_dashboard
+        
         # Initialize predictor
         predictor = MLBPredictor()
         
         # Get predictions
         print("🎯 Generating predictions...")
-        predictions = predictor.get_daily_predictions()
+        with tracing.span('predictions', 'stage'):
+            predictions = predictor.get_daily_predictions()
         
         if not predictions:
             print("⚠️ No predictions available for today")
@@ -82,7 +86,8 @@ def run_daily_predictions():
         
         # Generate HTML dashboard
         print(f"\n🌐 Generating HTML dashboard...")
-        success = generate_dashboard('mlb_dashboard.html', open_browser=False)
+        with tracing.span('dashboard', 'stage'):
+            success = generate_dashboard('mlb_dashboard.html', open_browser=False)
         
         if success:
             print("✅ Dashboard generated successfully!")
@@ -100,18 +105,23 @@ def run_daily_predictions():
 
 def main():
     """Main entry point"""
-    if len(sys.argv) > 1:
-        if sys.argv[1] == '--dashboard-only':
+    args = tracing.enable_from_argv(sys.argv[1:])
+    if args:
+        if args[0] == '--dashboard-only':
             print("🌐 Generating dashboard only...")
+            from dashboard import generate_dashboard
             success = generate_dashboard('mlb_dashboard.html', open_browser=True)
             sys.exit(0 if success else 1)
-        elif sys.argv[1] == '--help':
+        elif args[0] == '--help':
             print("MLB Predictor Dashboard - Whop Store Ready")
             print("")
             print("Usage:")
             print("  python main.py                 # Run predictions and generate dashboard")
             print("  python main.py --dashboard-only # Generate dashboard and open in browser")
             print("  python main.py --help          # Show this help")
+            print("")
+            print("Options:")
+            print("  --trace[=PATH]                 # Write a Chrome trace of pipeline stages (default trace.json)")
             sys.exit(0)
     
     # Run full prediction pipeline
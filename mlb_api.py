@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+HTTP Client for the MLB Stats API
+
+One pooled keep-alive requests.Session shared by every call, with the
+timeout and retry count from config.API_CONFIG, exponential backoff on
+429/5xx and connection errors, optional rate limiter / circuit breaker
+hooks (see rate_limit.py), an optional on-disk response cache with
+conditional requests (see http_cache.py) and per-endpoint latency, retry
+and cache counters.
+"""
+
+import json
+import threading
+import time
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+import config
+from rate_limit import RETRYABLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+class EndpointStats:
+    """Latency and retry counters for one endpoint"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.cache_hits = 0
+        self.not_modified = 0
+        self.bytes = 0
+        self.parse_seconds = 0.0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def as_dict(self):
+        """Counters plus mean latency"""
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'failures': self.failures,
+            'cache_hits': self.cache_hits,
+            'not_modified': self.not_modified,
+            'bytes': self.bytes,
+            'parse_ms': round(self.parse_seconds * 1000, 1),
+            'mean_ms': round(self.total_seconds / self.requests * 1000, 1) if self.requests else None,
+            'max_ms': round(self.max_seconds * 1000, 1)
+        }
+
+class MLBApiClient:
+    """Pooled, retrying client for statsapi.mlb.com (safe to share between threads)"""
+
+    def __init__(self, base_url=None, timeout=None, retries=None, backoff_factor=None,
+                 pool_size=None, rate_limiter=None, circuit_breaker=None, cache=None):
+        api_config = config.API_CONFIG
+        self.base_url = (base_url or api_config['base_url']).rstrip('/')
+        self.timeout = timeout if timeout is not None else api_config['timeout']
+        self.retries = retries if retries is not None else api_config['retries']
+        self.backoff_factor = backoff_factor if backoff_factor is not None else api_config['backoff_factor']
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+
+        # Keep-alive pool sized to the fetch concurrency; retries are handled here
+        pool_size = pool_size or config.FETCH_CONFIG['workers']
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.stats = {}
+        self.stats_lock = threading.Lock()
+
+    def _record(self, endpoint, seconds=None, retry=False, failure=False,
+                cache_hit=False, not_modified=False, size=0, parse_seconds=0.0):
+        """Update the counters for an endpoint"""
+        with self.stats_lock:
+            stats = self.stats.setdefault(endpoint, EndpointStats())
+            if seconds is not None:
+                stats.requests += 1
+                stats.total_seconds += seconds
+                stats.max_seconds = max(stats.max_seconds, seconds)
+            if retry:
+                stats.retries += 1
+            if failure:
+                stats.failures += 1
+            if cache_hit:
+                stats.cache_hits += 1
+            if not_modified:
+                stats.not_modified += 1
+            stats.bytes += size
+            stats.parse_seconds += parse_seconds
+
+    def _backoff_delay(self, attempt, response=None):
+        """Seconds to wait before retry number ``attempt`` (Retry-After wins)"""
+        if response is not None:
+            try:
+                return float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                pass
+        return self.backoff_factor * (2 ** attempt)
+
+    def url_for(self, path, params=None):
+        """Full request URL including the query string (also the cache key)"""
+        url = path if path.startswith('http') else f"{self.base_url}{path}"
+        return requests.Request('GET', url, params=params).prepare().url
+
+    def get(self, endpoint, path, params=None, headers=None):
+        """GET base_url + path, retrying transient failures; returns the response
+
+        ``endpoint`` names the counters the call is recorded under. Raises
+        requests.HTTPError for non-retryable errors and the last error once
+        retries are exhausted.
+        """
+        url = path if path.startswith('http') else f"{self.base_url}{path}"
+
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response, error = None, e
+            self._record(endpoint, time.perf_counter() - start)
+
+            if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError:
+                    self._record(endpoint, failure=True)
+                    raise
+                if self.rate_limiter:
+                    self.rate_limiter.success()
+                if self.circuit_breaker:
+                    self.circuit_breaker.record_success()
+                return response
+
+            delay = self._backoff_delay(attempt, response)
+            if response is not None and self.rate_limiter:
+                self.rate_limiter.backoff(delay)
+
+            if attempt < self.retries and not (self.circuit_breaker and self.circuit_breaker.is_open):
+                self._record(endpoint, retry=True)
+                reason = error or f"HTTP {response.status_code}"
+                logger.warning(f"{endpoint}: {reason}, retrying in {delay:.1f}s ({attempt + 1}/{self.retries})")
+                time.sleep(delay)
+                continue
+
+            self._record(endpoint, failure=True)
+            if self.circuit_breaker:
+                self.circuit_breaker.record_failure()
+            if error:
+                raise error
+            response.raise_for_status()
+
+    def _decode(self, endpoint, body):
+        """Parse a JSON body, counting its size and parse time"""
+        start = time.perf_counter()
+        data = json.loads(body)
+        self._record(endpoint, size=len(body), parse_seconds=time.perf_counter() - start)
+        return data
+
+    def _get_json_cached(self, endpoint, path, params, ttl, parse_unchanged):
+        """Return (document, changed), serving and revalidating through the cache"""
+        if self.cache is None:
+            return self._decode(endpoint, self.get(endpoint, path, params).content), True
+
+        url = self.url_for(path, params)
+        entry = self.cache.get(url)
+        if entry and entry.is_fresh:
+            self._record(endpoint, cache_hit=True)
+            return (self._decode(endpoint, entry.body) if parse_unchanged else None), False
+
+        response = self.get(endpoint, url, headers=entry.conditional_headers() if entry else None)
+        if response.status_code == 304 and entry:
+            self._record(endpoint, not_modified=True)
+            self.cache.refresh(url, endpoint, entry)
+            return (self._decode(endpoint, entry.body) if parse_unchanged else None), False
+
+        data = self._decode(endpoint, response.content)
+        seconds = ttl(data) if callable(ttl) else ttl
+        if seconds is None:
+            # Endpoint names may carry a request profile suffix, e.g. schedule:minimal
+            seconds = config.HTTP_CACHE['ttl'].get(endpoint.split(':', 1)[0], 0)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if seconds > 0 or etag or last_modified:
+            self.cache.put(url, endpoint, response.content, etag, last_modified, seconds)
+        return data, True
+
+    def get_json(self, endpoint, path, params=None, ttl=None):
+        """GET and decode a JSON document, using the cache when configured
+
+        ``ttl`` overrides the endpoint's configured TTL; it may be a number of
+        seconds or a function of the decoded document.
+        """
+        return self._get_json_cached(endpoint, path, params, ttl, parse_unchanged=True)[0]
+
+    def get_json_if_changed(self, endpoint, path, params=None, ttl=None):
+        """Like get_json, but None (without parsing) when the cached copy is still current"""
+        return self._get_json_cached(endpoint, path, params, ttl, parse_unchanged=False)[0]
+
+    def commit_cache(self, source_version=None):
+        """Persist cache entries from this run (call after the data is stored)"""
+        if self.cache:
+            self.cache.commit(source_version)
+
+    def get_stats(self):
+        """Per-endpoint counters as plain dicts"""
+        with self.stats_lock:
+            return {endpoint: stats.as_dict() for endpoint, stats in self.stats.items()}
+
+    def print_stats(self):
+        """Print per-endpoint request counts, latency and retries"""
+        stats = self.get_stats()
+        if not stats:
+            return
+
+        print("\n🌐 MLB API requests")
+        print("-" * 60)
+        for endpoint, s in sorted(stats.items()):
+            print(f"{endpoint:<18} {s['requests']:>5} req  mean {s['mean_ms'] or 0:7.1f} ms  "
+                  f"max {s['max_ms']:7.1f} ms  retries {s['retries']:>3}  failures {s['failures']:>3}  "
+                  f"cached {s['cache_hits']:>4}  304s {s['not_modified']:>4}  "
+                  f"{s['bytes'] / 1024:8.1f} KB  parse {s['parse_ms']:6.1f} ms")
+
+    def close(self):
+        """Close pooled connections and the cache"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
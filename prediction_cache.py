@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Persistent Prediction Cache for MLB Predictor
+
+Stores daily prediction results in a sidecar SQLite file so every entry
+point (main.py, dashboard.py, generate_static_site.py) that asks for the
+same slate reuses one computation. Entries are keyed by target date, model
+version, source database and a cheap fingerprint of the games rows the
+predictions depend on, so only a real data change triggers recomputation.
+"""
+
+import hashlib
+import json
+import os
+import logging
+import config
+import db
+
+logger = logging.getLogger(__name__)
+
+def games_fingerprint(conn, season, slate_rows):
+    """Fingerprint the games data a slate's predictions depend on
+
+    Combines cheap aggregates over the stats season (row count, latest
+    created_at, final games and first-inning runs) with the slate rows
+    themselves, so new results, re-inserted rows and pitcher changes all
+    produce a new fingerprint.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT
+            COUNT(*),
+            MAX(created_at),
+            SUM(CASE WHEN status = 'Final' THEN 1 ELSE 0 END),
+            TOTAL(COALESCE(away_first_runs, 0) + COALESCE(home_first_runs, 0))
+        FROM games
+        WHERE season = ?
+    """, (season,))
+    season_state = cursor.fetchone()
+
+    digest = hashlib.sha1()
+    digest.update(json.dumps([season, *season_state], default=str).encode('utf-8'))
+    for row in slate_rows:
+        digest.update(json.dumps(list(row), default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+class PredictionCache:
+    def __init__(self, cache_path=None, max_age_days=None):
+        if cache_path is None:
+            cache_path = config.PREDICTION_CACHE_PATH
+        if max_age_days is None:
+            max_age_days = config.PREDICTION_CACHE_DAYS
+        self.cache_path = cache_path
+        self.max_age_days = max_age_days
+        # WAL so concurrent entry points can read and update the cache
+        self.conn = db.connect_writer(cache_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS prediction_cache (
+                db_path TEXT NOT NULL,
+                target_date TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                predictions TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (db_path, target_date, model_version)
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def _db_key(db_path):
+        """Normalize the source database path so entries never mix databases"""
+        return os.path.abspath(db_path)
+
+    def get(self, db_path, target_date, model_version, fingerprint):
+        """Return cached predictions, or None when missing or stale"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT predictions FROM prediction_cache
+                WHERE db_path = ? AND target_date = ? AND model_version = ? AND fingerprint = ?
+            """, (self._db_key(db_path), target_date, model_version, fingerprint))
+            row = cursor.fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning(f"Error reading prediction cache: {e}")
+            return None
+
+    def put(self, db_path, target_date, model_version, fingerprint, predictions):
+        """Store predictions, replacing the entry for the same slate and evicting old ones"""
+        try:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO prediction_cache
+                (db_path, target_date, model_version, fingerprint, predictions)
+                VALUES (?, ?, ?, ?, ?)
+            """, (self._db_key(db_path), target_date, model_version, fingerprint, json.dumps(predictions)))
+            self.evict()
+            self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Error writing prediction cache: {e}")
+
+    def evict(self):
+        """Drop entries older than the configured maximum age"""
+        self.conn.execute(
+            "DELETE FROM prediction_cache WHERE created_at < datetime('now', ?)",
+            (f'-{int(self.max_age_days)} days',)
+        )
+
+    def clear(self):
+        """Remove every cached entry"""
+        self.conn.execute("DELETE FROM prediction_cache")
+        self.conn.commit()
+
+    def close(self):
+        """Close cache connection"""
+        self.conn.close()
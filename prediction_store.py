@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Prediction Persistence and Grading for MLB Predictor
+
+Slates from MLBPredictor(store_predictions=True).get_daily_predictions
+(the static site build) are upserted into the predictions table of the
+games database, one row per game id and model version: the
+probabilities, confidence, letter grade and bet flag. A row is only
+written before first pitch and is frozen from then on, so graded history
+always holds the pre-game pick. Actual first-inning outcomes are filled
+in incrementally. The fetcher grades a game in the same transaction that
+marks it Final, and grade_pending() catches rows saved after their game
+had already finished.
+The indexes serve per-grade and per-date rollups:
+
+    python prediction_store.py --since 2025-05-01
+"""
+
+import argparse
+import logging
+import config
+import db
+
+logger = logging.getLogger(__name__)
+
+# Game statuses before first pitch; stored predictions are frozen after these
+PREGAME_STATUSES = ('Scheduled', 'Pre-Game', 'Warmup', 'Delayed Start', 'Postponed')
+
+def get_grade_info(confidence, should_bet):
+    """Convert confidence to letter grade with description"""
+    if not should_bet:
+        return 'N/A', 'No Bet', '#666', 'Insufficient confidence'
+
+    conf_pct = confidence * 100
+
+    if conf_pct >= 70:
+        return 'A+', 'Elite', '#00C851', 'Highest confidence - Premium bet'
+    elif conf_pct >= 60:
+        return 'A', 'Excellent', '#2E7D32', 'Very high confidence'
+    elif conf_pct >= 50:
+        return 'B+', 'Strong', '#388E3C', 'High confidence'
+    elif conf_pct >= 40:
+        return 'B', 'Good', '#FFA726', 'Good confidence'
+    elif conf_pct >= 30:
+        return 'C+', 'Fair', '#FB8C00', 'Moderate confidence'
+    elif conf_pct >= 20:
+        return 'C', 'Decent', '#F57C00', 'Lower confidence'
+    elif conf_pct >= 15:
+        return 'D', 'Risky', '#FF5722', 'Low confidence - risky'
+    else:
+        return 'F', 'Avoid', '#D32F2F', 'Very low confidence'
+
+def create_predictions_table(conn):
+    """Create the predictions table and its rollup indexes if needed"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS predictions (
+            game_id TEXT NOT NULL,
+            model_version TEXT NOT NULL,
+            game_date TEXT NOT NULL,
+            prediction TEXT NOT NULL,
+            yrfi_probability REAL,
+            nrfi_probability REAL,
+            confidence REAL,
+            grade TEXT,
+            should_bet INTEGER NOT NULL DEFAULT 0,
+            data_quality TEXT,
+            actual TEXT,
+            correct INTEGER,
+            graded_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (game_id, model_version)
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_predictions_date ON predictions(game_date)")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_predictions_grade
+        ON predictions(model_version, grade, game_date, correct)
+    """)
+    # Only ungraded rows are indexed, so the grading pass never scans history
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_predictions_ungraded
+        ON predictions(game_id) WHERE actual IS NULL
+    """)
+
+def has_predictions_table(conn):
+    """Whether the database stores predictions"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='predictions'")
+    return cursor.fetchone() is not None
+
+def prediction_keys(predictions):
+    """Stable per-game keys for a slate ("away@home", "#2" for a doubleheader's second game)"""
+    keys = []
+    seen = {}
+    for pred in predictions:
+        matchup = f"{pred.get('away_team')}@{pred.get('home_team')}"
+        seen[matchup] = seen.get(matchup, 0) + 1
+        keys.append(matchup if seen[matchup] == 1 else f"{matchup}#{seen[matchup]}")
+    return keys
+
+def first_inning_outcome(status, home_first_runs, away_first_runs):
+    """'YRFI' / 'NRFI' for a final game with first-inning runs, else None"""
+    if status != 'Final' or home_first_runs is None or away_first_runs is None:
+        return None
+    return 'YRFI' if home_first_runs + away_first_runs > 0 else 'NRFI'
+
+def slate_games(conn, game_date):
+    """A date's games rows keyed like prediction_keys() keys the slate's predictions"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT game_id, away_team_name, home_team_name, status, home_first_runs, away_first_runs
+        FROM games
+        WHERE DATE(game_date) = ?
+        ORDER BY game_id
+    """, (game_date,))
+    rows = [
+        {
+            'game_id': row[0], 'away_team': row[1], 'home_team': row[2],
+            'status': row[3], 'home_first_runs': row[4], 'away_first_runs': row[5]
+        }
+        for row in cursor.fetchall()
+    ]
+    return dict(zip(prediction_keys(rows), rows))
+
+def save_predictions(conn, predictions, model_version):
+    """Upsert a slate's pre-game predictions and grade any whose game already finished
+
+    Only games that have not started are written: a row is frozen from
+    first pitch on (and once graded), so re-rendering a finished slate,
+    whose stats already include its own results, can never replace the
+    pick that was published before the game. created_at and grading are
+    always kept. Returns the number of rows offered for saving.
+    """
+    rows = []
+    for pred in predictions:
+        # Predictions are tied to their games row by id, never by matchup
+        if pred.get('game_id') is None:
+            continue
+        confidence = pred.get('confidence', 0)
+        should_bet = pred.get('should_bet', False)
+        rows.append((
+            str(pred['game_id']), model_version, pred['game_date'][:10], pred.get('prediction', 'NO_BET'),
+            pred.get('yrfi_probability'), pred.get('nrfi_probability'), confidence,
+            get_grade_info(confidence, should_bet)[0], int(should_bet), pred.get('data_quality')
+        ))
+    if not rows:
+        return 0
+
+    statuses = ', '.join('?' * len(PREGAME_STATUSES))
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(f"""
+            INSERT INTO predictions (
+                game_id, model_version, game_date, prediction, yrfi_probability,
+                nrfi_probability, confidence, grade, should_bet, data_quality
+            )
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE COALESCE((SELECT status FROM games WHERE game_id = ?1), 'Scheduled') IN ({statuses})
+            ON CONFLICT (game_id, model_version) DO UPDATE SET
+                prediction = excluded.prediction,
+                yrfi_probability = excluded.yrfi_probability,
+                nrfi_probability = excluded.nrfi_probability,
+                confidence = excluded.confidence,
+                grade = excluded.grade,
+                should_bet = excluded.should_bet,
+                data_quality = excluded.data_quality
+            WHERE actual IS NULL
+              AND (prediction IS NOT excluded.prediction
+                   OR yrfi_probability IS NOT excluded.yrfi_probability
+                   OR confidence IS NOT excluded.confidence
+                   OR should_bet IS NOT excluded.should_bet
+                   OR data_quality IS NOT excluded.data_quality)
+        """, [row + PREGAME_STATUSES for row in rows])
+        grade_pending(conn)
+    return len(rows)
+
+def grade_games(cursor, games):
+    """Grade the stored predictions of games that just went (or stayed) Final
+
+    ``games`` are (game_id, status, home_first_runs, away_first_runs)
+    tuples; games without an outcome are skipped.
+    """
+    updates = []
+    for game_id, status, home_runs, away_runs in games:
+        outcome = first_inning_outcome(status, home_runs, away_runs)
+        if outcome:
+            updates.append((outcome, outcome, str(game_id)))
+    if not updates:
+        return 0
+
+    cursor.executemany("""
+        UPDATE predictions
+        SET actual = ?, correct = (prediction = ?), graded_at = CURRENT_TIMESTAMP
+        WHERE game_id = ?
+    """, updates)
+    return len(updates)
+
+def grade_pending(conn):
+    """Grade ungraded predictions whose game is already Final; returns rows graded"""
+    cursor = conn.execute("""
+        UPDATE predictions
+        SET actual = g.outcome, correct = (predictions.prediction = g.outcome), graded_at = CURRENT_TIMESTAMP
+        FROM (
+            SELECT game_id,
+                   CASE WHEN home_first_runs + away_first_runs > 0 THEN 'YRFI' ELSE 'NRFI' END AS outcome
+            FROM games
+            WHERE status = 'Final' AND home_first_runs IS NOT NULL AND away_first_runs IS NOT NULL
+        ) AS g
+        WHERE predictions.game_id = g.game_id AND predictions.actual IS NULL
+    """)
+    return cursor.rowcount
+
+def grade_rollup(conn, since=None, until=None, model_version=None, bets_only=True):
+    """Predictions, graded, correct and hit rate per grade"""
+    query = """
+        SELECT grade, COUNT(*), COUNT(actual), TOTAL(correct)
+        FROM predictions
+        WHERE game_date >= ? AND game_date <= ?
+    """
+    params = [since or '0000-00-00', until or '9999-99-99']
+    if model_version:
+        query += " AND model_version = ?"
+        params.append(model_version)
+    if bets_only:
+        query += " AND should_bet = 1"
+    query += " GROUP BY grade ORDER BY grade"
+
+    return [
+        {
+            'grade': grade,
+            'predictions': total,
+            'graded': graded,
+            'correct': int(correct),
+            'hit_rate': correct / graded if graded else None
+        }
+        for grade, total, graded, correct in conn.execute(query, params).fetchall()
+    ]
+
+def main():
+    """Print per-grade hit rates from the predictions table"""
+    parser = argparse.ArgumentParser(description='Per-grade performance of stored predictions')
+    parser.add_argument('--db', default=config.DATABASE_PATH, help='SQLite database path')
+    parser.add_argument('--since', help='First game date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Last game date (YYYY-MM-DD)')
+    parser.add_argument('--model-version', help='Only this model version')
+    parser.add_argument('--all', action='store_true', help='Include games without a bet recommendation')
+    args = parser.parse_args()
+
+    conn = db.connect_readonly(args.db)
+    if not has_predictions_table(conn):
+        print("❌ No predictions stored yet")
+        return
+
+    rows = grade_rollup(conn, args.since, args.until, args.model_version, bets_only=not args.all)
+    print(f"{'Grade':<6} {'Predictions':>11} {'Graded':>7} {'Correct':>8} {'Hit rate':>9}")
+    print("-" * 45)
+    for row in rows:
+        hit_rate = f"{row['hit_rate']:.1%}" if row['hit_rate'] is not None else '-'
+        print(f"{row['grade']:<6} {row['predictions']:>11} {row['graded']:>7} {row['correct']:>8} {hit_rate:>9}")
+
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,16 @@ Key improvements:
 """
 
 import sqlite3
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
 import warnings
 import config
+import db
+import prediction_store
+import season_stats
+import tracing
+from prediction_cache import PredictionCache, games_fingerprint
 
 warnings.filterwarnings('ignore')
 
@@ -28,12 +32,177 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump when the scoring model changes so cached predictions are recomputed
+MODEL_VERSION = 'v4.1'
+
+# Scoring model parameters. These are the defaults used by MLBPredictor and can be
+# overridden per call of score_matchups (e.g. for parameter sweeps).
+QUALITY_LEVELS = ('excellent', 'good', 'fair', 'poor')
+
+LEAGUE_YRFI_RATE = 0.486  # Slightly under 50% YRFI historically
+
+# Column order of the rate/game matrices passed to score_matchups
+STAT_COLUMNS = ('home_pitcher', 'away_pitcher', 'home_team', 'away_team')
+
+# (weight with data, weight when falling back to the league rate)
+PITCHER_WEIGHTS = (0.3, 0.15)  # Pitchers have significant impact
+TEAM_WEIGHTS = (0.2, 0.1)
+
+# Games needed for (full, limited) quality points
+PITCHER_QUALITY_GAMES = (5, 3)
+TEAM_QUALITY_GAMES = (20, 10)
+
+# Regression towards the league rate by data quality
+CALIBRATION_MULTIPLIERS = {
+    'excellent': 1.0,   # Full confidence in the calculation
+    'good': 0.8,        # Slight regression to mean
+    'fair': 0.6,        # More regression to mean
+    'poor': 0.4         # Heavy regression to mean
+}
+
+# Confidence boost by data quality
+CONFIDENCE_MULTIPLIERS = {
+    'excellent': 2.5,
+    'good': 2.0,
+    'fair': 1.5,
+    'poor': 1.0
+}
+
+# (low, high, bonus): bonus applies when probability <= low or >= high, first match wins
+EXTREME_BONUS_BANDS = (
+    (0.3, 0.7, 0.15),
+    (0.35, 0.65, 0.10),
+    (0.4, 0.6, 0.05)
+)
+
+def stats_matrix(matchups):
+    """Build (rates, games) matrices from (home_pitcher, away_pitcher, home_team, away_team) stats tuples
+
+    Missing stats (None) become a NaN rate and zero games.
+    """
+    rates = np.full((len(matchups), len(STAT_COLUMNS)), np.nan)
+    games = np.zeros((len(matchups), len(STAT_COLUMNS)), dtype=np.int64)
+    for i, row in enumerate(matchups):
+        for j, stats in enumerate(row):
+            if stats:
+                rates[i, j] = stats['yrfi_rate']
+                games[i, j] = stats['games']
+    return rates, games
+
+def _quality_scores(rates, games, pitcher_quality_games=PITCHER_QUALITY_GAMES,
+                    team_quality_games=TEAM_QUALITY_GAMES):
+    """Vectorized data quality score (0-100) and index into QUALITY_LEVELS"""
+    present = ~np.isnan(rates)
+    full = np.array([pitcher_quality_games[0]] * 2 + [team_quality_games[0]] * 2)
+    limited = np.array([pitcher_quality_games[1]] * 2 + [team_quality_games[1]] * 2)
+
+    points = np.where(present & (games >= full), 25, np.where(present & (games >= limited), 15, 0))
+    quality_score = points.sum(axis=1)
+
+    quality_index = np.select(
+        [quality_score >= 85, quality_score >= 65, quality_score >= 45],
+        [0, 1, 2],
+        default=3
+    )
+    return quality_score, quality_index
+
+def _calibrated_probability(rates, quality_index, league_yrfi_rate=LEAGUE_YRFI_RATE,
+                            pitcher_weights=PITCHER_WEIGHTS, team_weights=TEAM_WEIGHTS,
+                            calibration_multipliers=CALIBRATION_MULTIPLIERS):
+    """Vectorized weighted YRFI probability regressed towards the league rate
+
+    ``league_yrfi_rate`` may be a scalar or a length-N array (e.g. point-in-time rates).
+    """
+    league_yrfi_rate = np.asarray(league_yrfi_rate, dtype=float)
+    present = ~np.isnan(rates)
+    filled = np.where(present, rates, league_yrfi_rate[..., None])
+    weights = np.where(
+        present,
+        np.array([pitcher_weights[0]] * 2 + [team_weights[0]] * 2),
+        np.array([pitcher_weights[1]] * 2 + [team_weights[1]] * 2)
+    )
+
+    # Accumulate column by column so results match the scalar sum() exactly
+    weighted_sum = filled[:, 0] * weights[:, 0]
+    weight_total = weights[:, 0]
+    for j in range(1, len(STAT_COLUMNS)):
+        weighted_sum = weighted_sum + filled[:, j] * weights[:, j]
+        weight_total = weight_total + weights[:, j]
+    weighted_yrfi_prob = np.where(weight_total > 0, weighted_sum / weight_total, league_yrfi_rate)
+
+    multiplier = np.array([calibration_multipliers[q] for q in QUALITY_LEVELS])[quality_index]
+    calibrated_prob = (weighted_yrfi_prob * multiplier) + (league_yrfi_rate * (1 - multiplier))
+
+    # Ensure probability stays in reasonable bounds
+    return np.clip(calibrated_prob, 0.2, 0.8)
+
+def _confidence(yrfi_probability, quality_index, confidence_multipliers=CONFIDENCE_MULTIPLIERS,
+                extreme_bonus_bands=EXTREME_BONUS_BANDS):
+    """Vectorized confidence from distance to 50/50, data quality and extreme probabilities"""
+    base_confidence = np.abs(yrfi_probability - 0.5) * 2  # Scale to 0-1
+
+    extreme_bonus = np.select(
+        [(yrfi_probability <= low) | (yrfi_probability >= high) for low, high, _ in extreme_bonus_bands],
+        [bonus for _, _, bonus in extreme_bonus_bands],
+        default=0
+    )
+
+    multiplier = np.array([confidence_multipliers[q] for q in QUALITY_LEVELS])[quality_index]
+    confidence = (base_confidence * multiplier) + extreme_bonus
+    return np.minimum(confidence, 0.95)  # Cap at 95%
+
+def score_matchups(rates, games, league_yrfi_rate=LEAGUE_YRFI_RATE,
+                   confidence_thresholds=config.CONFIDENCE_THRESHOLDS,
+                   pitcher_weights=PITCHER_WEIGHTS, team_weights=TEAM_WEIGHTS,
+                   pitcher_quality_games=PITCHER_QUALITY_GAMES, team_quality_games=TEAM_QUALITY_GAMES,
+                   calibration_multipliers=CALIBRATION_MULTIPLIERS,
+                   confidence_multipliers=CONFIDENCE_MULTIPLIERS,
+                   extreme_bonus_bands=EXTREME_BONUS_BANDS):
+    """Score N matchups at once.
+
+    ``rates`` and ``games`` are (N, 4) arrays in STAT_COLUMNS order; a NaN rate
+    marks missing stats. ``league_yrfi_rate`` may be a scalar or a length-N
+    array. Returns a dict of length-N arrays.
+    """
+    rates = np.asarray(rates, dtype=float).reshape(-1, len(STAT_COLUMNS))
+    games = np.asarray(games).reshape(-1, len(STAT_COLUMNS))
+
+    quality_score, quality_index = _quality_scores(
+        rates, games, pitcher_quality_games, team_quality_games
+    )
+    yrfi_probability = _calibrated_probability(
+        rates, quality_index, league_yrfi_rate, pitcher_weights, team_weights, calibration_multipliers
+    )
+    confidence = _confidence(yrfi_probability, quality_index, confidence_multipliers, extreme_bonus_bands)
+
+    min_confidence = np.array([confidence_thresholds[q] for q in QUALITY_LEVELS])[quality_index]
+
+    return {
+        'yrfi_probability': yrfi_probability,
+        'confidence': confidence,
+        'should_bet': confidence >= min_confidence,
+        'min_confidence_required': min_confidence,
+        'quality_score': quality_score,
+        'quality_index': quality_index,
+        'data_quality': np.array(QUALITY_LEVELS)[quality_index]
+    }
+
 class MLBPredictor:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, use_cache=True, store_predictions=False):
         if db_path is None:
             db_path = config.DATABASE_PATH
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        
+        # Shared on-disk cache of daily predictions across entry points
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = PredictionCache()
+            except Exception as e:
+                logger.warning(f"Prediction cache unavailable: {e}")
+        
+        # Opt-in: persist every slate (and its later grading) in the predictions table
+        self.store_predictions = store_predictions
         
         # Realistic confidence thresholds for betting recommendations
         self.confidence_thresholds = {
@@ -43,17 +212,41 @@ class MLBPredictor:
             'poor': 0.08        # Lower threshold for more bets (8%)
         }
         
-        # Base rates for calibration (from actual data analysis)
-        self.league_yrfi_rate = 0.486  # Slightly under 50% YRFI historically
+        # Read precomputed season aggregates when the database maintains them
+        self.has_season_stats = season_stats.has_season_stats(self.conn)
+        
+        # Base rates for calibration (from the maintained league aggregates)
+        self.league_yrfi_rate = self.get_league_yrfi_rate()
         
         logger.info("MLB Predictor v4 (Unbiased) initialized")
 
+    @property
+    def conn(self):
+        """The calling thread's shared read-only connection (see db.get_connection)
+
+        Resolved on every use so one predictor can be shared by worker
+        threads; rows are returned as sqlite3.Row through each cursor's
+        row factory.
+        """
+        return db.get_connection(self.db_path, readonly=True)
+
+    def _fetchall(self, name, query, params=()):
+        """Run a query and fetch all rows, timed as a trace span"""
+        with tracing.span(f"sql {name}", 'sql'):
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
     def get_pitcher_stats(self, pitcher_name, season=None, min_games=3):
         """Get pitcher statistics with proper null handling"""
         if season is None:
             season = config.CURRENT_SEASON
             
         try:
+            if self.has_season_stats:
+                return self._get_season_stats('pitcher_season_stats', 'pitcher', [pitcher_name], season, min_games).get(pitcher_name)
+            
             query = """
             SELECT 
                 COUNT(*) as games,
@@ -66,15 +259,16 @@ class MLBPredictor:
             AND status = 'Final'
             """
             
-            result = pd.read_sql_query(query, self.conn, params=[pitcher_name, pitcher_name, season])
+            rows = self._fetchall('pitcher_stats', query, [pitcher_name, pitcher_name, season])
+            result = rows[0] if rows else None
             
-            if len(result) == 0 or result.iloc[0]['games'] < min_games:
+            if result is None or result['games'] < min_games:
                 return None
                 
             return {
-                'games': int(result.iloc[0]['games']),
-                'yrfi_rate': float(result.iloc[0]['yrfi_rate']),
-                'avg_first_inning_runs': float(result.iloc[0]['avg_first_inning_runs'])
+                'games': int(result['games']),
+                'yrfi_rate': float(result['yrfi_rate']),
+                'avg_first_inning_runs': float(result['avg_first_inning_runs'])
             }
             
         except Exception as e:
@@ -87,6 +281,9 @@ class MLBPredictor:
             season = config.CURRENT_SEASON
             
         try:
+            if self.has_season_stats:
+                return self._get_season_stats('team_season_stats', 'team', [team_name], season, min_games).get(team_name)
+            
             query = """
             SELECT 
                 COUNT(*) as games,
@@ -99,15 +296,16 @@ class MLBPredictor:
             AND status = 'Final'
             """
             
-            result = pd.read_sql_query(query, self.conn, params=[team_name, team_name, season])
+            rows = self._fetchall('team_stats', query, [team_name, team_name, season])
+            result = rows[0] if rows else None
             
-            if len(result) == 0 or result.iloc[0]['games'] < min_games:
+            if result is None or result['games'] < min_games:
                 return None
                 
             return {
-                'games': int(result.iloc[0]['games']),
-                'yrfi_rate': float(result.iloc[0]['yrfi_rate']),
-                'avg_first_inning_runs': float(result.iloc[0]['avg_first_inning_runs'])
+                'games': int(result['games']),
+                'yrfi_rate': float(result['yrfi_rate']),
+                'avg_first_inning_runs': float(result['avg_first_inning_runs'])
             }
             
         except Exception as e:
@@ -116,138 +314,209 @@ class MLBPredictor:
 
     def assess_data_quality(self, home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats):
         """Assess data quality for the prediction"""
-        quality_score = 0
-        details = []
-        
-        # Pitcher data quality
-        if home_pitcher_stats and home_pitcher_stats['games'] >= 5:
-            quality_score += 25
-            details.append(f"Home pitcher: {home_pitcher_stats['games']} games")
-        elif home_pitcher_stats and home_pitcher_stats['games'] >= 3:
-            quality_score += 15
-            details.append(f"Home pitcher: {home_pitcher_stats['games']} games (limited)")
-        else:
-            details.append("Home pitcher: insufficient data")
-            
-        if away_pitcher_stats and away_pitcher_stats['games'] >= 5:
-            quality_score += 25
-            details.append(f"Away pitcher: {away_pitcher_stats['games']} games")
-        elif away_pitcher_stats and away_pitcher_stats['games'] >= 3:
-            quality_score += 15
-            details.append(f"Away pitcher: {away_pitcher_stats['games']} games (limited)")
-        else:
-            details.append("Away pitcher: insufficient data")
+        rates, games = stats_matrix([(home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats)])
+        quality_score, quality_index = _quality_scores(rates, games)
+        details = self._quality_details(home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats)
         
-        # Team data quality (teams typically have more games)
-        if home_team_stats and home_team_stats['games'] >= 20:
-            quality_score += 25
-            details.append(f"Home team: {home_team_stats['games']} games")
-        elif home_team_stats and home_team_stats['games'] >= 10:
-            quality_score += 15
-            details.append(f"Home team: {home_team_stats['games']} games (limited)")
-        else:
-            details.append("Home team: insufficient data")
-            
-        if away_team_stats and away_team_stats['games'] >= 20:
-            quality_score += 25
-            details.append(f"Away team: {away_team_stats['games']} games")
-        elif away_team_stats and away_team_stats['games'] >= 10:
-            quality_score += 15
-            details.append(f"Away team: {away_team_stats['games']} games (limited)")
-        else:
-            details.append("Away team: insufficient data")
-        
-        # Classify quality
-        if quality_score >= 85:
-            quality = 'excellent'
-        elif quality_score >= 65:
-            quality = 'good'
-        elif quality_score >= 45:
-            quality = 'fair'
-        else:
-            quality = 'poor'
-            
-        return quality, quality_score, details
+        return QUALITY_LEVELS[quality_index[0]], int(quality_score[0]), details
+
+    def _quality_details(self, home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats):
+        """Human readable data quality notes for each side of the matchup"""
+        details = []
+        sides = [
+            ('Home pitcher', home_pitcher_stats, PITCHER_QUALITY_GAMES),
+            ('Away pitcher', away_pitcher_stats, PITCHER_QUALITY_GAMES),
+            ('Home team', home_team_stats, TEAM_QUALITY_GAMES),
+            ('Away team', away_team_stats, TEAM_QUALITY_GAMES)
+        ]
+        for label, stats, (full_games, limited_games) in sides:
+            if stats and stats['games'] >= full_games:
+                details.append(f"{label}: {stats['games']} games")
+            elif stats and stats['games'] >= limited_games:
+                details.append(f"{label}: {stats['games']} games (limited)")
+            else:
+                details.append(f"{label}: insufficient data")
+            
+        return details
 
     def calculate_unbiased_prediction(self, home_pitcher_stats, away_pitcher_stats, 
                                     home_team_stats, away_team_stats, data_quality):
         """Calculate prediction with bias elimination"""
+        rates, _ = stats_matrix([(home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats)])
+        quality = data_quality if data_quality in QUALITY_LEVELS else 'poor'
+        quality_index = np.array([QUALITY_LEVELS.index(quality)])
         
-        # Start with league average as baseline
-        base_yrfi_prob = self.league_yrfi_rate
-        
-        # Collect YRFI rates with fallback to league average
-        rates = []
-        weights = []
-        
-        # Home pitcher contribution
-        if home_pitcher_stats:
-            rates.append(home_pitcher_stats['yrfi_rate'])
-            weights.append(0.3)  # Pitchers have significant impact
-        else:
-            rates.append(base_yrfi_prob)
-            weights.append(0.15)  # Reduced weight for missing data
-            
-        # Away pitcher contribution  
-        if away_pitcher_stats:
-            rates.append(away_pitcher_stats['yrfi_rate'])
-            weights.append(0.3)
-        else:
-            rates.append(base_yrfi_prob)
-            weights.append(0.15)
-            
-        # Home team contribution
-        if home_team_stats:
-            rates.append(home_team_stats['yrfi_rate'])
-            weights.append(0.2)
-        else:
-            rates.append(base_yrfi_prob)
-            weights.append(0.1)
-            
-        # Away team contribution
-        if away_team_stats:
-            rates.append(away_team_stats['yrfi_rate'])
-            weights.append(0.2)
-        else:
-            rates.append(base_yrfi_prob)
-            weights.append(0.1)
-        
-        # Calculate weighted average
-        if sum(weights) > 0:
-            weighted_yrfi_prob = sum(r * w for r, w in zip(rates, weights)) / sum(weights)
-        else:
-            weighted_yrfi_prob = base_yrfi_prob
-        
-        # Apply calibration based on data quality
-        quality_multipliers = {
-            'excellent': 1.0,   # Full confidence in the calculation
-            'good': 0.8,        # Slight regression to mean
-            'fair': 0.6,        # More regression to mean
-            'poor': 0.4         # Heavy regression to mean
-        }
-        
-        multiplier = quality_multipliers.get(data_quality, 0.4)
-        calibrated_prob = (weighted_yrfi_prob * multiplier) + (base_yrfi_prob * (1 - multiplier))
-        
-        # Ensure probability stays in reasonable bounds
-        calibrated_prob = max(0.2, min(0.8, calibrated_prob))
+        return float(_calibrated_probability(rates, quality_index, self.league_yrfi_rate)[0])
+
+    def score_matchups(self, rates, games):
+        """Score N matchups with this predictor's league rate and thresholds"""
+        return score_matchups(
+            rates, games,
+            league_yrfi_rate=self.league_yrfi_rate,
+            confidence_thresholds=self.confidence_thresholds
+        )
+
+    def get_league_yrfi_rate(self, season=None):
+        """Get the league YRFI rate for a season, falling back to the historical rate"""
+        if season is None:
+            season = config.CURRENT_SEASON
+            
+        if not self.has_season_stats:
+            return LEAGUE_YRFI_RATE
+            
+        try:
+            rows = self._fetchall(
+                'league_season_stats',
+                "SELECT games, yrfi_count FROM league_season_stats WHERE season = ?", (season,)
+            )
+            row = rows[0] if rows else None
+            
+            if row is None or row[0] < config.MIN_LEAGUE_GAMES:
+                return LEAGUE_YRFI_RATE
+                
+            return row[1] / row[0]
+            
+        except Exception as e:
+            logger.error(f"Error getting league YRFI rate for {season}: {e}")
+            return LEAGUE_YRFI_RATE
+
+    def _get_season_stats(self, table, key_column, names, season, min_games):
+        """Read precomputed season aggregates for the given names by primary key"""
+        names = sorted({name for name in names if isinstance(name, str)})
+        stats = {name: None for name in names}
+        if not names:
+            return stats
+            
+        placeholders = ', '.join('?' for _ in names)
+        rows = self._fetchall(table, f"""
+            SELECT {key_column}, games, yrfi_count, first_inning_runs
+            FROM {table}
+            WHERE season = ? AND {key_column} IN ({placeholders})
+        """, [season, *names])
         
-        return calibrated_prob
+        for name, games, yrfi_count, first_inning_runs in rows:
+            if games < min_games:
+                continue
+            # Same arithmetic as the raw AVG() and integer SUM()/COUNT() queries
+            stats[name] = {
+                'games': int(games),
+                'yrfi_rate': yrfi_count / games,
+                'avg_first_inning_runs': float(first_inning_runs // games)
+            }
+            
+        return stats
+
+    def get_slate_stats(self, pitchers, teams, season=None, min_pitcher_games=3, min_team_games=10):
+        """Get pitcher and team statistics for a whole slate in two grouped scans.
+
+        Returns ``(pitcher_stats, team_stats)`` dicts keyed by name whose values
+        match what ``get_pitcher_stats``/``get_team_stats`` return for that name
+        (``None`` when below the minimum game count or missing).
+        """
+        if season is None:
+            season = config.CURRENT_SEASON
+
+        if self.has_season_stats:
+            try:
+                return (
+                    self._get_season_stats('pitcher_season_stats', 'pitcher', pitchers, season, min_pitcher_games),
+                    self._get_season_stats('team_season_stats', 'team', teams, season, min_team_games)
+                )
+            except Exception as e:
+                logger.error(f"Error reading season aggregates, falling back to games table: {e}")
+
+        pitcher_stats = self._get_grouped_stats(
+            'home_pitcher', 'away_pitcher', pitchers, season, min_pitcher_games
+        )
+        team_stats = self._get_grouped_stats(
+            'home_team_name', 'away_team_name', teams, season, min_team_games
+        )
+        return pitcher_stats, team_stats
+
+    def _get_grouped_stats(self, home_column, away_column, names, season, min_games):
+        """Aggregate per-name stats over games where the name appears on either side"""
+        names = sorted({name for name in names if isinstance(name, str)})
+        stats = {name: None for name in names}
+        if not names:
+            return stats
+
+        try:
+            # UNION (not UNION ALL) keeps one row per (game, name) so a game is
+            # counted once per name, exactly like the OR filter in the per-name queries
+            placeholders = ', '.join('?' for _ in names)
+            query = f"""
+            SELECT
+                name,
+                COUNT(*) as games,
+                AVG(yrfi) as yrfi_rate,
+                SUM(first_runs) / COUNT(*) as avg_first_inning_runs
+            FROM (
+                SELECT game_id, {home_column} as name,
+                       CASE WHEN (COALESCE(away_first_runs, 0) > 0 OR COALESCE(home_first_runs, 0) > 0)
+                            THEN 1 ELSE 0 END as yrfi,
+                       COALESCE(away_first_runs, 0) + COALESCE(home_first_runs, 0) as first_runs
+                FROM games
+                WHERE season = ? AND status = 'Final' AND {home_column} IN ({placeholders})
+                UNION
+                SELECT game_id, {away_column} as name,
+                       CASE WHEN (COALESCE(away_first_runs, 0) > 0 OR COALESCE(home_first_runs, 0) > 0)
+                            THEN 1 ELSE 0 END as yrfi,
+                       COALESCE(away_first_runs, 0) + COALESCE(home_first_runs, 0) as first_runs
+                FROM games
+                WHERE season = ? AND status = 'Final' AND {away_column} IN ({placeholders})
+            )
+            GROUP BY name
+            """
+
+            rows = self._fetchall(f'grouped_stats {home_column}', query, [season, *names, season, *names])
+
+            for row in rows:
+                if row['games'] < min_games:
+                    continue
+                stats[row['name']] = {
+                    'games': int(row['games']),
+                    'yrfi_rate': float(row['yrfi_rate']),
+                    'avg_first_inning_runs': float(row['avg_first_inning_runs'])
+                }
+
+        except Exception as e:
+            logger.error(f"Error getting grouped stats for {home_column}/{away_column}: {e}")
+
+        return stats
 
     def make_prediction(self, home_team, away_team, home_pitcher, away_pitcher):
         """Make unbiased YRFI/NRFI prediction"""
+        return self.predict_from_stats(
+            home_team, away_team, home_pitcher, away_pitcher,
+            self.get_pitcher_stats(home_pitcher),
+            self.get_pitcher_stats(away_pitcher),
+            self.get_team_stats(home_team),
+            self.get_team_stats(away_team)
+        )
+
+    def predict_from_stats(self, home_team, away_team, home_pitcher, away_pitcher,
+                           home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats):
+        """Make unbiased YRFI/NRFI prediction from already fetched statistics"""
+        with tracing.span(f"score {away_team} @ {home_team}", 'scoring'):
+            return self._predict_from_stats(
+                home_team, away_team, home_pitcher, away_pitcher,
+                home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats
+            )
+
+    def _predict_from_stats(self, home_team, away_team, home_pitcher, away_pitcher,
+                            home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats):
+        """Untraced body of predict_from_stats"""
         try:
             logger.info(f"\n=== Making prediction for {away_team} @ {home_team} ===")
             logger.info(f"Pitchers: {away_pitcher} vs {home_pitcher}")
             
-            # Get statistics
-            home_pitcher_stats = self.get_pitcher_stats(home_pitcher)
-            away_pitcher_stats = self.get_pitcher_stats(away_pitcher)
-            home_team_stats = self.get_team_stats(home_team)
-            away_team_stats = self.get_team_stats(away_team)
+            # Score the matchup with the vectorized kernel
+            rates, games = stats_matrix([(home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats)])
+            scores = self.score_matchups(rates, games)
             
-            # Assess data quality
-            data_quality, quality_score, quality_details = self.assess_data_quality(
+            data_quality = str(scores['data_quality'][0])
+            quality_score = int(scores['quality_score'][0])
+            quality_details = self._quality_details(
                 home_pitcher_stats, away_pitcher_stats, home_team_stats, away_team_stats
             )
             
@@ -255,40 +524,13 @@ class MLBPredictor:
             for detail in quality_details:
                 logger.info(f"  - {detail}")
             
-            # Calculate unbiased prediction
-            yrfi_probability = self.calculate_unbiased_prediction(
-                home_pitcher_stats, away_pitcher_stats,
-                home_team_stats, away_team_stats, data_quality
-            )
-            
-            # Determine confidence and prediction with improved calculation
-            base_confidence = abs(yrfi_probability - 0.5) * 2  # Scale to 0-1
-            
-            # Boost confidence based on data quality and how far from 50/50
-            quality_multipliers = {
-                'excellent': 2.5,
-                'good': 2.0,
-                'fair': 1.5,
-                'poor': 1.0
-            }
-            
-            # Additional confidence from extreme probabilities
-            extreme_bonus = 0
-            if yrfi_probability <= 0.3 or yrfi_probability >= 0.7:
-                extreme_bonus = 0.15
-            elif yrfi_probability <= 0.35 or yrfi_probability >= 0.65:
-                extreme_bonus = 0.10
-            elif yrfi_probability <= 0.4 or yrfi_probability >= 0.6:
-                extreme_bonus = 0.05
-            
-            confidence = (base_confidence * quality_multipliers.get(data_quality, 1.0)) + extreme_bonus
-            confidence = min(confidence, 0.95)  # Cap at 95%
-            
+            yrfi_probability = float(scores['yrfi_probability'][0])
+            confidence = float(scores['confidence'][0])
             prediction = 'YRFI' if yrfi_probability > 0.5 else 'NRFI'
             
             # Check if we should make a bet based on data quality and confidence
-            min_confidence = self.confidence_thresholds.get(data_quality, 0.52)
-            should_bet = confidence >= min_confidence
+            min_confidence = float(scores['min_confidence_required'][0])
+            should_bet = bool(scores['should_bet'][0])
             
             logger.info(f"YRFI probability: {yrfi_probability:.3f}")
             logger.info(f"Confidence: {confidence:.3f}")
@@ -325,6 +567,7 @@ class MLBPredictor:
                 'error': str(e)
             }
 
+    @tracing.traced('get_daily_predictions', 'predictions')
     def get_daily_predictions(self, target_date=None):
         """Get predictions for a specific date"""
         if target_date is None:
@@ -334,6 +577,7 @@ class MLBPredictor:
             # First try to find games for today's date in current season
             query = """
             SELECT DISTINCT
+                game_id,
                 game_date,
                 home_team_name as home_team,
                 away_team_name as away_team,
@@ -342,10 +586,10 @@ class MLBPredictor:
             FROM games 
             WHERE DATE(game_date) = ?
             AND season = ?
-            ORDER BY game_date
+            ORDER BY game_date, game_id
             """
             
-            games = pd.read_sql_query(query, self.conn, params=[target_date, config.CURRENT_SEASON])
+            games = self._fetchall('daily_slate', query, [target_date, config.CURRENT_SEASON])
             
             if len(games) == 0:
                 logger.info(f"No games found for {target_date} in {config.CURRENT_SEASON} season")
@@ -357,19 +601,20 @@ class MLBPredictor:
                 ORDER BY season DESC, game_date DESC
                 LIMIT 10
                 """
-                available_dates = pd.read_sql_query(date_check_query, self.conn)
+                available_dates = self._fetchall('available_dates', date_check_query)
                 logger.info("Recent available dates in database:")
-                for _, row in available_dates.iterrows():
+                for row in available_dates:
                     logger.info(f"  {row['game_date']} (Season {row['season']}) - {row['game_count']} games")
                 
                 # Try most recent date with games
                 if len(available_dates) > 0:
-                    recent_date = available_dates.iloc[0]['game_date']
-                    recent_season = available_dates.iloc[0]['season']
+                    recent_date = available_dates[0]['game_date']
+                    recent_season = available_dates[0]['season']
                     logger.info(f"Using most recent available date: {recent_date}")
                     
                     fallback_query = """
                     SELECT DISTINCT
+                        game_id,
                         game_date,
                         home_team_name as home_team,
                         away_team_name as away_team,
@@ -378,24 +623,48 @@ class MLBPredictor:
                     FROM games 
                     WHERE DATE(game_date) = ?
                     AND season = ?
-                    ORDER BY game_date
+                    ORDER BY game_date, game_id
                     """
-                    games = pd.read_sql_query(fallback_query, self.conn, params=[recent_date, recent_season])
+                    games = self._fetchall('fallback_slate', fallback_query, [recent_date, recent_season])
                     target_date = recent_date
                     
             if len(games) == 0:
                 logger.info(f"No games found for any available date")
                 return []
             
+            # Reuse predictions computed for the same slate and data
+            fingerprint = None
+            if self.cache:
+                with tracing.span('prediction cache lookup', 'cache'):
+                    fingerprint = games_fingerprint(
+                        self.conn, config.CURRENT_SEASON, games
+                    )
+                    cached = self.cache.get(self.db_path, target_date, MODEL_VERSION, fingerprint)
+                if cached is not None:
+                    logger.info(f"Using cached predictions for {target_date} ({len(cached)} games)")
+                    self.save_predictions(cached)
+                    return cached
+            
+            # Fetch every pitcher's and team's stats for the slate up front
+            pitcher_stats, team_stats = self.get_slate_stats(
+                [game['home_pitcher'] for game in games] + [game['away_pitcher'] for game in games],
+                [game['home_team'] for game in games] + [game['away_team'] for game in games]
+            )
+            
             predictions = []
-            for _, game in games.iterrows():
-                prediction = self.make_prediction(
+            for game in games:
+                prediction = self.predict_from_stats(
                     game['home_team'], game['away_team'],
-                    game['home_pitcher'], game['away_pitcher']
+                    game['home_pitcher'], game['away_pitcher'],
+                    pitcher_stats.get(game['home_pitcher']),
+                    pitcher_stats.get(game['away_pitcher']),
+                    team_stats.get(game['home_team']),
+                    team_stats.get(game['away_team'])
                 )
                 
                 if prediction:
                     prediction.update({
+                        'game_id': game['game_id'],
                         'game_date': game['game_date'],
                         'home_team': game['home_team'],
                         'away_team': game['away_team'],
@@ -418,13 +687,42 @@ class MLBPredictor:
             if betting_games > 0:
                 logger.info(f"YRFI/NRFI split: {yrfi_predictions/betting_games*100:.1f}% / {nrfi_predictions/betting_games*100:.1f}%")
             
+            if self.cache:
+                with tracing.span('prediction cache store', 'cache'):
+                    self.cache.put(self.db_path, target_date, MODEL_VERSION, fingerprint, predictions)
+            
+            self.save_predictions(predictions)
             return predictions
             
         except Exception as e:
             logger.error(f"Error getting daily predictions: {e}")
             return []
 
+    def save_predictions(self, predictions):
+        """Upsert a slate into the predictions table (failures are logged, not raised)"""
+        if not self.store_predictions or not predictions:
+            return
+        try:
+            with tracing.span('store predictions', 'sql', games=len(predictions)):
+                # The shared connection is read-only, so writes use their own
+                conn = db.connect_writer(self.db_path)
+                try:
+                    prediction_store.create_predictions_table(conn)
+                    saved = prediction_store.save_predictions(conn, predictions, MODEL_VERSION)
+                finally:
+                    conn.close()
+            logger.info(f"Stored {saved} predictions ({MODEL_VERSION})")
+        except Exception as e:
+            logger.warning(f"Could not store predictions: {e}")
+
+    def close(self):
+        """Close the prediction cache and this thread's database connections"""
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+        db.close_thread_connections()
+
     def __del__(self):
-        """Close database connection"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
+        """Close the prediction cache (the shared database connection stays open)"""
+        if getattr(self, 'cache', None):
+            self.cache.close()
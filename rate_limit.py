@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Rate Limiting for MLB Stats API Fetches
+
+A thread-safe token bucket shared by concurrent fetch workers, which halves
+its rate when the API answers 429/5xx and creeps back up on success
+(additive increase, multiplicative decrease), and a circuit breaker that
+stops a run after too many consecutive failures.
+"""
+
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+class TokenBucket:
+    """Adaptive token-bucket rate limiter"""
+
+    def __init__(self, rate, burst=None, min_rate=1.0, recovery_step=0.5):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.recovery_step = recovery_step
+        self.capacity = float(burst or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        """Add tokens for the time elapsed since the last refill"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def backoff(self, retry_after=None):
+        """Halve the rate and pause everyone after a 429/5xx response"""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+            self.tokens = 0.0
+        logger.warning(f"API pushback, slowing to {self.rate:.1f} requests/s for at least {pause:.1f}s")
+
+    def success(self):
+        """Recover the rate gradually after a successful request"""
+        if self.rate < self.max_rate:
+            with self.lock:
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+class CircuitBreaker:
+    """Trip after a run of consecutive failures"""
+
+    def __init__(self, failure_threshold=5):
+        self.failure_threshold = failure_threshold
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """Whether requests should stop"""
+        return self.failures >= self.failure_threshold
+
+    def record_success(self):
+        """Reset the consecutive failure count"""
+        with self.lock:
+            self.failures = 0
+
+    def record_failure(self):
+        """Count a failed request"""
+        with self.lock:
+            self.failures += 1
+            if self.failures == self.failure_threshold:
+                logger.error(f"Circuit breaker open after {self.failures} consecutive failures")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Materialized Season Aggregates for MLB Predictor
+
+Maintains per-season pitcher, team and league first-inning aggregates so the
+predictor can read them by primary key instead of scanning the games table.
+The fetcher applies each game change incrementally; run this script to
+rebuild the tables for an existing database.
+"""
+
+import sys
+import logging
+import config
+import db
+
+logger = logging.getLogger(__name__)
+
+# Columns of a games row that feed the aggregates
+GAME_STAT_COLUMNS = (
+    'season', 'status', 'home_pitcher', 'away_pitcher',
+    'home_team_name', 'away_team_name', 'home_first_runs', 'away_first_runs'
+)
+
+def create_season_stats_tables(conn):
+    """Create aggregate tables, rebuilding them from games when newly created
+
+    Returns True if the tables had to be created.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='league_season_stats'")
+    existed = cursor.fetchone() is not None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS pitcher_season_stats (
+            pitcher TEXT NOT NULL,
+            season INTEGER NOT NULL,
+            games INTEGER NOT NULL DEFAULT 0,
+            yrfi_count INTEGER NOT NULL DEFAULT 0,
+            first_inning_runs INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (pitcher, season)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS team_season_stats (
+            team TEXT NOT NULL,
+            season INTEGER NOT NULL,
+            games INTEGER NOT NULL DEFAULT 0,
+            yrfi_count INTEGER NOT NULL DEFAULT 0,
+            first_inning_runs INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (team, season)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS league_season_stats (
+            season INTEGER PRIMARY KEY,
+            games INTEGER NOT NULL DEFAULT 0,
+            yrfi_count INTEGER NOT NULL DEFAULT 0,
+            first_inning_runs INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    if not existed:
+        rebuild_season_stats(conn)
+    return not existed
+
+def has_season_stats(conn):
+    """Check whether the aggregate tables exist in this database"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='league_season_stats'")
+    return cursor.fetchone() is not None
+
+def rebuild_season_stats(conn):
+    """Recompute every aggregate row from the games table"""
+    cursor = conn.cursor()
+
+    # Same per-game definitions as the predictor's raw queries
+    final_games = """
+        SELECT game_id, season, home_pitcher, away_pitcher, home_team_name, away_team_name,
+               CASE WHEN (COALESCE(away_first_runs, 0) > 0 OR COALESCE(home_first_runs, 0) > 0)
+                    THEN 1 ELSE 0 END as yrfi,
+               COALESCE(away_first_runs, 0) + COALESCE(home_first_runs, 0) as first_runs
+        FROM games
+        WHERE status = 'Final'
+    """
+
+    cursor.execute("DELETE FROM pitcher_season_stats")
+    cursor.execute("DELETE FROM team_season_stats")
+    cursor.execute("DELETE FROM league_season_stats")
+
+    # UNION de-duplicates (game, name) so a name on both sides counts once
+    for table, name_column, home_column, away_column in (
+        ('pitcher_season_stats', 'pitcher', 'home_pitcher', 'away_pitcher'),
+        ('team_season_stats', 'team', 'home_team_name', 'away_team_name')
+    ):
+        cursor.execute(f"""
+            INSERT INTO {table} ({name_column}, season, games, yrfi_count, first_inning_runs)
+            SELECT name, season, COUNT(*), SUM(yrfi), SUM(first_runs)
+            FROM (
+                SELECT game_id, season, {home_column} as name, yrfi, first_runs FROM ({final_games})
+                WHERE {home_column} IS NOT NULL
+                UNION
+                SELECT game_id, season, {away_column} as name, yrfi, first_runs FROM ({final_games})
+                WHERE {away_column} IS NOT NULL
+            )
+            WHERE season IS NOT NULL
+            GROUP BY name, season
+        """)
+
+    cursor.execute(f"""
+        INSERT INTO league_season_stats (season, games, yrfi_count, first_inning_runs)
+        SELECT season, COUNT(*), SUM(yrfi), SUM(first_runs)
+        FROM ({final_games})
+        WHERE season IS NOT NULL
+        GROUP BY season
+    """)
+
+    conn.commit()
+    logger.info("Season aggregate tables rebuilt from games")
+
+def load_game(cursor, game_id):
+    """Load the aggregate-relevant columns of a stored game, or None"""
+    cursor.execute(
+        f"SELECT {', '.join(GAME_STAT_COLUMNS)} FROM games WHERE game_id = ?",
+        (game_id,)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(zip(GAME_STAT_COLUMNS, row))
+
+def _game_contributions(game):
+    """Yield (table, key column, name, season, yrfi, runs) rows a Final game adds"""
+    if not game or game['status'] != 'Final' or game['season'] is None:
+        return
+
+    home_runs = game['home_first_runs'] or 0
+    away_runs = game['away_first_runs'] or 0
+    yrfi = 1 if (home_runs > 0 or away_runs > 0) else 0
+    runs = home_runs + away_runs
+
+    for pitcher in {game['home_pitcher'], game['away_pitcher']} - {None}:
+        yield 'pitcher_season_stats', 'pitcher', pitcher, game['season'], yrfi, runs
+    for team in {game['home_team_name'], game['away_team_name']} - {None}:
+        yield 'team_season_stats', 'team', team, game['season'], yrfi, runs
+
+def _add_game(cursor, game, sign):
+    """Add (sign=1) or remove (sign=-1) a Final game's contribution"""
+    contributions = list(_game_contributions(game))
+    if not contributions:
+        return
+
+    for table, key_column, name, season, yrfi, runs in contributions:
+        cursor.execute(f"""
+            INSERT INTO {table} ({key_column}, season, games, yrfi_count, first_inning_runs)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT ({key_column}, season) DO UPDATE SET
+                games = games + excluded.games,
+                yrfi_count = yrfi_count + excluded.yrfi_count,
+                first_inning_runs = first_inning_runs + excluded.first_inning_runs
+        """, (name, season, sign, sign * yrfi, sign * runs))
+
+    _, _, _, season, yrfi, runs = contributions[0]
+    cursor.execute("""
+        INSERT INTO league_season_stats (season, games, yrfi_count, first_inning_runs)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (season) DO UPDATE SET
+            games = games + excluded.games,
+            yrfi_count = yrfi_count + excluded.yrfi_count,
+            first_inning_runs = first_inning_runs + excluded.first_inning_runs
+    """, (season, sign, sign * yrfi, sign * runs))
+
+def apply_game_change(cursor, old_game, new_game):
+    """Update aggregates for a game written over its previous stored version
+
+    Both arguments are dicts from load_game (or None). Only transitions that
+    involve a Final game touch the tables, so re-writing an unchanged Final
+    game is a no-op.
+    """
+    if old_game == new_game:
+        return
+    _add_game(cursor, old_game, -1)
+    _add_game(cursor, new_game, 1)
+
+def main():
+    """Rebuild aggregate tables for an existing database"""
+    db_path = sys.argv[1] if len(sys.argv) > 1 else config.DATABASE_PATH
+    print(f"Rebuilding season aggregates in {db_path}...")
+
+    conn = db.connect_writer(db_path)
+    if not create_season_stats_tables(conn):
+        rebuild_season_stats(conn)
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT season, games, yrfi_count FROM league_season_stats ORDER BY season")
+    for season, games, yrfi_count in cursor.fetchall():
+        print(f"  {season}: {games} final games, YRFI rate {yrfi_count / games:.3f}")
+
+    conn.close()
+    print("Season aggregates rebuilt!")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -23,6 +23,7 @@ def setup_database():
         return True
     else:
         print("⚠️ Source database not found, creating minimal database...")
+        print("   (run 'python backfill.py 2021-2025' to build a full one from the MLB Stats API)")
         create_minimal_database(target_db)
         return True
 
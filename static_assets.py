@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Static Asset Pipeline for the docs/ Site
+
+The site's CSS and JS live in templates/ and are published as minified,
+content-hashed files under docs/assets/ (e.g. assets/site.3f9c2a1b7d.css),
+so a URL only ever serves one version and browsers and CDNs can cache it
+indefinitely; superseded versions are pruned. Files are published
+uncompressed and compression is left to the host (GitHub Pages, which
+serves the committed docs/, gzips responses itself), so size_report()
+prints raw sizes, the gzip sizes the host is expected to send and the
+bytes a viewer downloads per page view.
+"""
+
+import functools
+import gzip
+import hashlib
+import os
+import re
+import templating
+
+ASSET_DIR = 'assets'
+SITE_ASSETS = ('site.css', 'site.js')
+
+def minify_css(text):
+    """Drop comments and insignificant whitespace from a stylesheet"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,>])\s*', r'\1', text)
+    text = re.sub(r':\s+', ':', text)
+    return text.replace(';}', '}').strip()
+
+def minify_js(text):
+    """Drop indentation, blank lines and whole-line comments from a script"""
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+@functools.lru_cache(maxsize=None)
+def build_asset(name):
+    """(hashed file name, minified content) for an asset in templates/"""
+    with open(os.path.join(templating.TEMPLATE_DIR, name), encoding='utf-8') as f:
+        text = f.read()
+
+    stem, ext = os.path.splitext(name)
+    content = MINIFIERS.get(ext, str)(text)
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:10]
+    return f"{stem}.{digest}{ext}", content
+
+def asset_urls():
+    """Site-relative URLs of the current CSS and JS, keyed by asset type"""
+    return {
+        os.path.splitext(name)[1][1:]: f"{ASSET_DIR}/{build_asset(name)[0]}"
+        for name in SITE_ASSETS
+    }
+
+def publish_assets(docs_dir):
+    """Write any missing hashed assets and prune superseded ones; returns their URLs"""
+    asset_dir = os.path.join(docs_dir, ASSET_DIR)
+    os.makedirs(asset_dir, exist_ok=True)
+
+    for name in SITE_ASSETS:
+        file_name, content = build_asset(name)
+        path = os.path.join(asset_dir, file_name)
+        if not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        prune_assets(asset_dir, name, file_name)
+    return asset_urls()
+
+def prune_assets(asset_dir, name, current):
+    """Delete earlier hashed versions of an asset, keeping ``current``"""
+    stem, ext = os.path.splitext(name)
+    pattern = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{10}}{re.escape(ext)}")
+    for file_name in os.listdir(asset_dir):
+        if file_name != current and pattern.fullmatch(file_name):
+            os.remove(os.path.join(asset_dir, file_name))
+
+def file_sizes(path):
+    """Raw and gzip sizes of a published file (the host compresses on the fly)"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    return {'raw': len(content), 'gz': len(gzip.compress(content, compresslevel=9, mtime=0))}
+
+def transfer_size(sizes):
+    """Bytes sent for a file by a host that gzips responses"""
+    return min(sizes.values())
+
+def size_report(docs_dir, files, page_files, asset_files, refresh_files=()):
+    """Print per-file sizes and the bytes a viewer downloads per page view
+
+    ``page_files`` are fetched on every view, ``asset_files`` only on the
+    first one and ``refresh_files`` by each in-page refresh; the remaining
+    ``files`` are listed for reference.
+    """
+    sizes = {path: file_sizes(os.path.join(docs_dir, path)) for path in files}
+
+    print("\n📦 docs/ size report (files are published uncompressed; the host gzips responses)")
+    print("-" * 64)
+    print(f"{'file':<30} {'raw':>10} {'gzip':>10}")
+    for path, s in sizes.items():
+        print(f"{path:<30} {s['raw']:>10,} {s['gz']:>10,}")
+
+    repeat_view = sum(transfer_size(sizes[path]) for path in page_files)
+    first_view = repeat_view + sum(transfer_size(sizes[path]) for path in asset_files)
+    print(f"Per page view (gzipped by the host): {first_view:,} bytes first visit, {repeat_view:,} bytes with cached assets")
+    if refresh_files:
+        refresh = sum(transfer_size(sizes[path]) for path in refresh_files)
+        print(f"Per refresh: {refresh:,} bytes when the data changed, a 304 otherwise")
+    return first_view, repeat_view
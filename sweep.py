@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Parameter Sweep for MLB Predictor
+
+Evaluates grid or random configurations of the scoring kernel's weights,
+quality multipliers, extreme-probability bonus bands and confidence
+thresholds against historical seasons. The point-in-time feature matrix
+from backtest.py is built once and handed to every worker of a process
+pool, so workers never touch SQLite and each configuration costs one
+vectorized scoring call.
+
+Configurations are ranked on the tuning seasons only; the latest season
+(or --holdout-season) is held out and the top configurations are scored
+on it, so the reported hit rate and ROI are out of sample.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from multiprocessing import Pool
+import numpy as np
+import config
+import db
+import predictor
+from backtest import build_feature_matrix
+
+DEFAULT_OUTPUT_PATH = 'sweep_results.json'
+
+# Current hand-tuned values. The (with data, league fallback) weight pairs
+# are swept separately: their ratio sets how much a missing stat's league
+# rate counts against the stats that are present.
+DEFAULT_PARAMS = {
+    'pitcher_data_weight': predictor.PITCHER_WEIGHTS[0],
+    'pitcher_fallback_weight': predictor.PITCHER_WEIGHTS[1],
+    'team_data_weight': predictor.TEAM_WEIGHTS[0],
+    'team_fallback_weight': predictor.TEAM_WEIGHTS[1],
+    'calibration_multipliers': predictor.CALIBRATION_MULTIPLIERS,
+    'confidence_multipliers': predictor.CONFIDENCE_MULTIPLIERS,
+    'extreme_bonus_bands': predictor.EXTREME_BONUS_BANDS,
+    'confidence_thresholds': config.CONFIDENCE_THRESHOLDS
+}
+
+# Candidate scale factors per parameter for grid search (1.0 = current value).
+# The probability is a weighted average, so only weight ratios matter and the
+# pitcher data weight stays fixed as the reference.
+SWEEP_GRID = {
+    'pitcher_data_weight': (1.0,),
+    'pitcher_fallback_weight': (0.5, 1.0, 1.5),
+    'team_data_weight': (0.5, 1.0, 1.5),
+    'team_fallback_weight': (0.5, 1.0, 1.5),
+    'calibration_multipliers': (0.5, 0.75, 1.0),
+    'confidence_multipliers': (0.75, 1.0, 1.25),
+    'extreme_bonus_bands': (0.0, 1.0, 1.5),
+    'confidence_thresholds': (1.0, 1.5, 2.0, 3.0)
+}
+
+# Random search draws each scale factor uniformly from this range
+RANDOM_SCALE_RANGE = (0.5, 2.0)
+
+def scale_param(name, value, factor):
+    """Scale a parameter's numeric values by a factor, keeping its structure"""
+    if name == 'extreme_bonus_bands':
+        # Only the bonus is scaled; the probability bands stay fixed
+        return tuple((low, high, bonus * factor) for low, high, bonus in value)
+    if name == 'calibration_multipliers':
+        # Multipliers are blend weights and must stay within [0, 1]
+        return {k: min(v * factor, 1.0) for k, v in value.items()}
+    if isinstance(value, dict):
+        return {k: v * factor for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(v * factor for v in value)
+    return value * factor
+
+def make_params(factors):
+    """Build score_matchups keyword arguments from per-parameter scale factors"""
+    scaled = {name: scale_param(name, DEFAULT_PARAMS[name], factors[name]) for name in DEFAULT_PARAMS}
+    params = {name: value for name, value in scaled.items() if not name.endswith('_weight')}
+    params['pitcher_weights'] = (scaled['pitcher_data_weight'], scaled['pitcher_fallback_weight'])
+    params['team_weights'] = (scaled['team_data_weight'], scaled['team_fallback_weight'])
+    return params
+
+def grid_factors(grid=SWEEP_GRID):
+    """Yield every combination of the grid's scale factors"""
+    names = list(grid)
+    for combo in itertools.product(*(grid[name] for name in names)):
+        yield dict(zip(names, combo))
+
+def random_factors(samples, seed=None):
+    """Yield random scale factors for each parameter (the reference weight stays at 1.0)"""
+    rng = np.random.default_rng(seed)
+    low, high = RANDOM_SCALE_RANGE
+    for _ in range(samples):
+        factors = {name: round(float(rng.uniform(low, high)), 4) for name in DEFAULT_PARAMS}
+        factors['pitcher_data_weight'] = 1.0
+        yield factors
+
+# Feature matrix shared with worker processes (set once by the pool initializer)
+_features = None
+
+def _init_worker(features):
+    """Install the shared read-only feature matrix in a worker process"""
+    global _features
+    _features = features
+    for array in features.values():
+        array.flags.writeable = False
+
+def evaluate(factors, features=None):
+    """Score all historical games with one configuration and return its metrics"""
+    features = features if features is not None else _features
+    scores = predictor.score_matchups(
+        features['rates'], features['game_counts'],
+        league_yrfi_rate=features['league_rates'],
+        **make_params(factors)
+    )
+
+    correct = (scores['yrfi_probability'] > 0.5) == features['actual_yrfi']
+    bets = scores['should_bet']
+    bet_count = int(bets.sum())
+    bet_wins = int((correct & bets).sum())
+
+    # Flat one-unit stakes at the configured odds
+    odds = config.BETTING_STRATEGY['american_odds']
+    payout = 100 / abs(odds) if odds < 0 else odds / 100
+    profit = bet_wins * payout - (bet_count - bet_wins)
+
+    return {
+        'factors': factors,
+        'accuracy': round(float(correct.mean()), 4),
+        'bets': bet_count,
+        'bet_frequency': round(bet_count / len(correct), 4),
+        'bet_hit_rate': round(bet_wins / bet_count, 4) if bet_count else None,
+        'roi': round(profit / bet_count, 4) if bet_count else None
+    }
+
+def load_features(db_path, seasons=None):
+    """Build the shared feature matrix from the database once"""
+    conn = db.connect_readonly(db_path)
+    games, rates, game_counts, league_rates = build_feature_matrix(conn, seasons)
+    conn.close()
+    return {
+        'rates': rates,
+        'game_counts': game_counts,
+        'league_rates': league_rates,
+        'actual_yrfi': games['yrfi'].to_numpy() == 1,
+        'season': games['season'].to_numpy()
+    }
+
+def split_features(features, holdout_season):
+    """(tuning, held-out) feature matrices, split on the held-out season"""
+    held_out = features['season'] == holdout_season
+    return (
+        {name: array[~held_out] for name, array in features.items()},
+        {name: array[held_out] for name, array in features.items()}
+    )
+
+def run_sweep(features, factor_sets, workers=None):
+    """Evaluate every configuration across a process pool"""
+    factor_sets = list(factor_sets)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(factor_sets) // (workers * 8))
+
+    with Pool(workers, initializer=_init_worker, initargs=(features,)) as pool:
+        return pool.map(evaluate, factor_sets, chunksize=chunksize)
+
+def _sort_key(result):
+    """Rank by ROI, then hit rate; configurations without bets go last"""
+    return (
+        result['roi'] if result['roi'] is not None else float('-inf'),
+        result['bet_hit_rate'] or 0
+    )
+
+def main():
+    """Run a parameter sweep from the command line"""
+    parser = argparse.ArgumentParser(description='Parameter sweep for the MLB YRFI/NRFI predictor')
+    parser.add_argument('--db', default=config.DATABASE_PATH, help='SQLite database path')
+    parser.add_argument('--season', type=int, action='append', help='Season to evaluate (repeatable, default: all)')
+    parser.add_argument('--holdout-season', type=int, help='Season held out of tuning (default: the latest)')
+    parser.add_argument('--random', type=int, metavar='N', help='Evaluate N random configurations instead of the grid')
+    parser.add_argument('--seed', type=int, help='Random search seed')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores)')
+    parser.add_argument('--min-bets', type=int, default=50, help='Minimum bets for a configuration to be ranked')
+    parser.add_argument('--top', type=int, default=10, help='Number of configurations to print')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='JSON output path')
+    args = parser.parse_args()
+
+    print("Building feature matrix...")
+    features = load_features(args.db, args.season)
+    seasons = sorted(set(features['season'].tolist()))
+    print(f"Loaded {len(features['actual_yrfi'])} historical games")
+
+    holdout_season = args.holdout_season if args.holdout_season is not None else seasons[-1]
+    if len(seasons) < 2 or holdout_season not in seasons:
+        print(f"❌ Need a held-out season and at least one other season to tune on (loaded {seasons})")
+        return
+    tuning, holdout = split_features(features, holdout_season)
+    tuning_seasons = [season for season in seasons if season != holdout_season]
+    print(f"Tuning on {tuning_seasons} ({len(tuning['actual_yrfi'])} games), "
+          f"holding out {holdout_season} ({len(holdout['actual_yrfi'])} games)")
+
+    factor_sets = random_factors(args.random, args.seed) if args.random else grid_factors()
+
+    start = time.perf_counter()
+    results = run_sweep(tuning, factor_sets, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Evaluated {len(results)} configurations in {elapsed:.1f}s ({len(results) / elapsed:.0f}/s)")
+
+    baseline = evaluate({name: 1.0 for name in DEFAULT_PARAMS}, tuning)
+    results.sort(key=_sort_key, reverse=True)
+    ranked = [r for r in results if r['bets'] >= args.min_bets]
+
+    # Only the configurations chosen on the tuning seasons see the held-out one
+    for result in [baseline] + ranked[:args.top]:
+        result['holdout'] = {
+            key: value for key, value in evaluate(result['factors'], holdout).items() if key != 'factors'
+        }
+    for result in [baseline] + results:
+        result['params'] = make_params(result['factors'])
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'tuning_seasons': tuning_seasons,
+            'holdout_season': holdout_season,
+            'baseline': baseline,
+            'results': results
+        }, f, indent=2)
+    print(f"Generated {args.output}")
+
+    def describe(metrics):
+        roi = f"{metrics['roi']:+.1%}" if metrics['roi'] is not None else 'n/a'
+        hit_rate = f"{metrics['bet_hit_rate']:.1%}" if metrics['bet_hit_rate'] is not None else 'n/a'
+        return (f"accuracy {metrics['accuracy']:.1%} | bets {metrics['bets']} "
+                f"({metrics['bet_frequency']:.1%}) | hit rate {hit_rate} | ROI {roi}")
+
+    print(f"\nCurrent parameters:\n     tuning   {describe(baseline)}\n     held out {describe(baseline['holdout'])}")
+    print(f"\nTop {min(args.top, len(ranked))} configurations (ranked on {tuning_seasons}):")
+    for i, result in enumerate(ranked[:args.top], 1):
+        print(f"{i:>3}. tuning   {describe(result)}")
+        print(f"     held out {describe(result['holdout'])}")
+        print(f"     factors: {result['factors']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Synthetic Database Generator for MLB Predictor
+
+Builds games databases of arbitrary size with realistic structure for
+scale testing: 30-team (or larger, for minor leagues) seasons of ~162 games
+per team, five-man rotations with spot starters, pitcher turnover between
+seasons and first-inning runs drawn from pitcher/offense propensities that
+reproduce the league's ~48% YRFI rate. The final season is left partially
+played, like the live database.
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+import numpy as np
+from fetch_mlb_data import MLBDataFetcher
+import config
+import season_stats
+
+GAMES_PER_TEAM = 162
+SEASON_START = (4, 1)  # April 1
+ROTATION_SIZE = 5
+SPOT_STARTERS = 8           # Extra starters available to each team per season
+SPOT_START_RATE = 0.25      # Share of starts not made by the rotation
+ROTATION_TURNOVER = 0.4     # Share of rotation replaced between seasons
+HALF_INNING_RUN_RATE = 0.33  # Poisson mean; exp(-2 * 0.33) ~= 52% NRFI
+PLAYED_SHARE_LAST_SEASON = 0.25
+
+def _season_schedule(rng, teams, games_needed):
+    """Random daily pairings until a season's game count is reached"""
+    pairs_per_day = teams // 2
+    days = -(-games_needed // pairs_per_day)
+    order = np.argsort(rng.random((days, teams)), axis=1)[:, :pairs_per_day * 2]
+    home = order[:, 0::2].ravel()[:games_needed]
+    away = order[:, 1::2].ravel()[:games_needed]
+    day = np.repeat(np.arange(days), pairs_per_day)[:games_needed]
+    return day, home, away
+
+def generate_games(total_games, teams=30, seed=0):
+    """Yield games rows (as tuples) for a synthetic database of the given size"""
+    rng = np.random.default_rng(seed)
+    games_per_season = teams * GAMES_PER_TEAM // 2
+    seasons = max(1, -(-total_games // games_per_season))
+    # The last (partially played) season is the configured current season
+    first_season = config.CURRENT_SEASON - seasons + 1
+
+    team_names = [f"Team {i + 1:03d}" for i in range(teams)]
+    offense = rng.lognormal(0, 0.15, teams)
+
+    next_pitcher = 0
+    pitcher_skill = []
+
+    def new_pitchers(count):
+        nonlocal next_pitcher
+        ids = np.arange(next_pitcher, next_pitcher + count)
+        next_pitcher += count
+        pitcher_skill.extend(rng.lognormal(0, 0.25, count))
+        return ids
+
+    rotations = new_pitchers(teams * ROTATION_SIZE).reshape(teams, ROTATION_SIZE)
+    game_id = 100000
+    remaining = total_games
+
+    for s in range(seasons):
+        season = first_season + s
+        count = min(games_per_season, remaining)
+        remaining -= count
+
+        # Rotation turnover plus a fresh pool of spot starters each season
+        if s > 0:
+            replace = rng.random(rotations.shape) < ROTATION_TURNOVER
+            rotations = np.where(replace, new_pitchers(rotations.size).reshape(rotations.shape), rotations)
+        spot_pool = new_pitchers(teams * SPOT_STARTERS).reshape(teams, SPOT_STARTERS)
+        skill = np.asarray(pitcher_skill)
+
+        day, home, away = _season_schedule(rng, teams, count)
+        starts = np.zeros(teams, dtype=np.int64)
+
+        def starters(side):
+            slot = np.empty(len(side), dtype=np.int64)
+            for i, team in enumerate(side):
+                slot[i] = starts[team] % ROTATION_SIZE
+                starts[team] += 1
+            spot = rng.random(len(side)) < SPOT_START_RATE
+            return np.where(
+                spot,
+                spot_pool[side, rng.integers(0, SPOT_STARTERS, len(side))],
+                rotations[side, slot]
+            )
+
+        home_pitcher = starters(home)
+        away_pitcher = starters(away)
+
+        # Runs scored by a side depend on its offense and the opposing starter
+        home_first = rng.poisson(HALF_INNING_RUN_RATE * offense[home] * skill[away_pitcher])
+        away_first = rng.poisson(HALF_INNING_RUN_RATE * offense[away] * skill[home_pitcher])
+        home_score = home_first + rng.poisson(4.0, count)
+        away_score = away_first + rng.poisson(4.0, count)
+
+        start = date(season, *SEASON_START)
+        played_days = day.max() + 1 if s < seasons - 1 else int((day.max() + 1) * PLAYED_SHARE_LAST_SEASON)
+
+        for i in range(count):
+            game_date = (start + timedelta(days=int(day[i]))).isoformat()
+            final = day[i] < played_days
+            yield (
+                str(game_id), game_date, season,
+                team_names[home[i]], team_names[away[i]],
+                f"Pitcher {home_pitcher[i]:06d}", f"Pitcher {away_pitcher[i]:06d}",
+                int(home_first[i]) if final else None, int(away_first[i]) if final else None,
+                int(home_score[i]) if final else None, int(away_score[i]) if final else None,
+                'Final' if final else 'Scheduled',
+                f"{game_date} 12:00:00"
+            )
+            game_id += 1
+
+def create_synthetic_database(db_path, total_games, teams=30, seed=0, batch_size=50000):
+    """Create (replacing) a synthetic database and return the number of games written"""
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    fetcher = MLBDataFetcher(db_path, use_http_cache=False)
+    fetcher.conn.execute("PRAGMA journal_mode = OFF")
+    fetcher.conn.execute("PRAGMA synchronous = OFF")
+    fetcher.create_tables()
+
+    cursor = fetcher.conn.cursor()
+    batch = []
+    written = 0
+    for row in generate_games(total_games, teams, seed):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            written += _insert_batch(cursor, batch)
+            batch = []
+    written += _insert_batch(cursor, batch)
+
+    # Same secondary indexes as the production database
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_game_date ON games(game_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_season ON games(season)")
+    fetcher.conn.commit()
+
+    # Aggregates are rebuilt once instead of maintained row by row
+    season_stats.rebuild_season_stats(fetcher.conn)
+    fetcher.close()
+    return written
+
+def _insert_batch(cursor, rows):
+    """Bulk insert generated rows"""
+    cursor.executemany("""
+        INSERT INTO games
+        (game_id, game_date, season, home_team_name, away_team_name,
+         home_pitcher, away_pitcher, home_first_runs, away_first_runs,
+         home_score, away_score, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    return len(rows)
+
+def parse_scale(value):
+    """Parse game counts like 10000, 100k or 1M"""
+    value = value.strip().lower()
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(value[-1], 1)
+    return int(float(value.rstrip('km')) * multiplier)
+
+def main():
+    """Generate a synthetic database from the command line"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic MLB games database')
+    parser.add_argument('games', type=parse_scale, help='Number of games, e.g. 10k, 100k, 1M')
+    parser.add_argument('--output', help='Database path (default: synthetic_<games>.db)')
+    parser.add_argument('--teams', type=int, default=30, help='Teams per league (use more for minor leagues)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    db_path = args.output or f"synthetic_{args.games}.db"
+    print(f"Generating {args.games:,} games with {args.teams} teams...")
+
+    start = time.perf_counter()
+    written = create_synthetic_database(db_path, args.games, args.teams, args.seed)
+    elapsed = time.perf_counter() - start
+
+    conn = sqlite3.connect(db_path)
+    pitchers = conn.execute("SELECT COUNT(DISTINCT pitcher) FROM pitcher_season_stats").fetchone()[0]
+    seasons = conn.execute("SELECT COUNT(*), AVG(1.0 * yrfi_count / games) FROM league_season_stats").fetchone()
+    conn.close()
+
+    print(f"Wrote {written:,} games to {db_path} in {elapsed:.1f}s")
+    print(f"Seasons: {seasons[0]}, pitchers with starts: {pitchers:,}, league YRFI rate: {seasons[1]:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+// Live refresh: poll the dashboard's JSON sidecar with conditional requests
+// and re-render only the game cards whose prediction changed
+const DATA_URL = document.body.dataset.src;
+const REFRESH_MS = (Number(document.body.dataset.refreshSeconds) || 300) * 1000;
+
+let etag = null;
+let lastModified = null;
+let signatures = null;  // card key -> markup it shows
+
+const pct = value => (value * 100).toFixed(1) + '%';
+const STAT_FORMATS = {
+    betting_pct: value => value.toFixed(1) + '% of games',
+    avg_confidence: pct
+};
+
+function animateCard(card, index) {
+    card.addEventListener('click', function() {
+        this.style.transform = this.style.transform === 'scale(1.02)' ? 'scale(1)' : 'scale(1.02)';
+    });
+    card.style.animationDelay = (index * 0.1) + 's';
+    card.style.animation = 'fadeInUp 0.6s ease forwards';
+}
+
+// Cards are rendered by the dashboard generator (templates/dashboard_card.html);
+// the sidecar carries each card's markup
+function renderCard(html) {
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+    return template.content.firstElementChild;
+}
+
+function applyData(data) {
+    // The page was rendered from this version: just remember what each card shows
+    const unchanged = signatures === null && data.version === document.body.dataset.version;
+
+    document.querySelectorAll('[data-stat]').forEach(el => {
+        const name = el.dataset.stat;
+        const raw = name in data.summary ? data.summary[name] : data[name];
+        if (raw === undefined) return;
+        const value = STAT_FORMATS[name] ? STAT_FORMATS[name](raw) : String(raw);
+        if (el.textContent !== value) el.textContent = value;
+    });
+
+    const grid = document.querySelector('.predictions-grid');
+    const existing = new Map();
+    grid.querySelectorAll('.game-card').forEach(card => existing.set(card.dataset.key, card));
+
+    const next = {};
+    let previous = null;
+    data.games.forEach(g => {
+        next[g.key] = g.html;
+
+        let card = existing.get(g.key);
+        existing.delete(g.key);
+        if (!card || (!unchanged && (signatures === null || signatures[g.key] !== g.html))) {
+            const rendered = renderCard(g.html);
+            animateCard(rendered, 0);
+            if (card) card.replaceWith(rendered);
+            card = rendered;
+        }
+
+        const expected = previous ? previous.nextElementSibling : grid.firstElementChild;
+        if (expected !== card) grid.insertBefore(card, expected);
+        previous = card;
+    });
+
+    existing.forEach(card => card.remove());
+    signatures = next;
+    document.body.dataset.version = data.version;
+}
+
+async function refreshDashboard() {
+    // Pages opened straight from disk cannot fetch their sidecar
+    if (location.protocol === 'file:') {
+        location.reload();
+        return;
+    }
+
+    const headers = {};
+    if (etag) headers['If-None-Match'] = etag;
+    if (lastModified) headers['If-Modified-Since'] = lastModified;
+
+    try {
+        const response = await fetch(DATA_URL, { headers, cache: 'no-store' });
+        if (response.status === 304 || !response.ok) return;
+        etag = response.headers.get('ETag');
+        lastModified = response.headers.get('Last-Modified');
+        applyData(await response.json());
+    } catch (error) {
+        console.warn('Refreshing the dashboard failed', error);
+    }
+}
+
+document.querySelectorAll('.game-card').forEach(animateCard);
+setInterval(refreshDashboard, REFRESH_MS);
@@ -0,0 +1,90 @@
+// Live refresh during game hours (1 PM - 11 PM EST): poll data.json with
+// conditional requests and re-render only the cards whose prediction changed
+const REFRESH_MS = (Number(document.body.dataset.refreshSeconds) || 300) * 1000;
+const GAME_HOURS = [13, 23];
+
+let etag = null;
+let lastModified = null;
+let signatures = null;  // card key -> markup it shows
+
+// Cards are rendered by the site generator (templates/site_card.html);
+// data.json carries each card's markup
+function renderCard(html) {
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+    return template.content.firstElementChild;
+}
+
+// data.json carries "HH:MM:SS EST"; the page shows "hh:mm AM EST"
+function displayTime(value) {
+    const match = /^(\d+):(\d+)/.exec(value || '');
+    if (!match) return value;
+    const hour = Number(match[1]);
+    const suffix = hour < 12 ? 'AM' : 'PM';
+    return `${String(hour % 12 || 12).padStart(2, '0')}:${match[2]} ${suffix} EST`;
+}
+
+function applyData(data) {
+    // The page was rendered from this version: just remember what each card shows
+    const unchanged = signatures === null && data.version === document.body.dataset.version;
+
+    document.querySelectorAll('[data-stat]').forEach(el => {
+        const name = el.dataset.stat;
+        const value = name === 'last_updated' ? displayTime(data.last_updated) : data[name];
+        if (value !== undefined && el.textContent !== String(value)) el.textContent = value;
+    });
+
+    const grid = document.querySelector('.predictions-grid');
+    const existing = new Map();
+    grid.querySelectorAll('.prediction-card').forEach(card => existing.set(card.dataset.key, card));
+
+    const next = {};
+    let previous = null;
+    data.predictions.forEach(p => {
+        next[p.key] = p.html;
+
+        let card = existing.get(p.key);
+        existing.delete(p.key);
+        if (!card || (!unchanged && (signatures === null || signatures[p.key] !== p.html))) {
+            const rendered = renderCard(p.html);
+            if (card) card.replaceWith(rendered);
+            card = rendered;
+        }
+
+        const expected = previous ? previous.nextElementSibling : grid.firstElementChild;
+        if (expected !== card) grid.insertBefore(card, expected);
+        previous = card;
+    });
+
+    existing.forEach(card => card.remove());
+    signatures = next;
+    document.body.dataset.version = data.version;
+}
+
+async function refresh() {
+    const headers = {};
+    if (etag) headers['If-None-Match'] = etag;
+    if (lastModified) headers['If-Modified-Since'] = lastModified;
+
+    try {
+        const response = await fetch('data.json', { headers, cache: 'no-store' });
+        if (response.status === 304 || !response.ok) return;
+        etag = response.headers.get('ETag');
+        lastModified = response.headers.get('Last-Modified');
+        applyData(await response.json());
+    } catch (error) {
+        console.warn('Refreshing predictions failed', error);
+    }
+}
+
+function scheduleRefresh() {
+    setTimeout(async () => {
+        const hour = new Date().getHours();
+        if (hour >= GAME_HOURS[0] && hour <= GAME_HOURS[1]) {
+            await refresh();
+        }
+        scheduleRefresh();
+    }, REFRESH_MS);
+}
+
+scheduleRefresh();
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Streaming Template Renderer for the HTML Pages
+
+Page skeletons and card templates live in templates/ and use str.format
+syntax ({name}, {value:.1%}, {theme[accent_color]}; literal braces are
+doubled). Each template is parsed once per process into literal text and
+fields, and render() yields fragments instead of building one string, so
+a page is streamed to disk through a buffered writer with memory bounded
+by the largest fragment. A field bound to a generator (e.g. the cards of
+a page) is expanded in place.
+"""
+
+import functools
+import hashlib
+import os
+import string
+import types
+import tracing
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+WRITE_BUFFER_SIZE = 64 * 1024
+
+_formatter = string.Formatter()
+
+class Template:
+    """A template parsed into (literal, field, conversion, format spec) parts"""
+
+    def __init__(self, text, name='<string>'):
+        self.name = name
+        # Changes whenever the template text does (used in fragment cache keys)
+        self.version = hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]
+        self.parts = [
+            (literal, field, conversion, spec or '')
+            for literal, field, spec, conversion in _formatter.parse(text)
+        ]
+
+    def render(self, **values):
+        """Yield the template's fragments for a set of values"""
+        for literal, field, conversion, spec in self.parts:
+            if literal:
+                yield literal
+            if field is None:
+                continue
+
+            value = _formatter.get_field(field, (), values)[0]
+            if isinstance(value, (types.GeneratorType, list, tuple)):
+                yield from value
+                continue
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            yield format(value, spec)
+
+    def render_string(self, **values):
+        """Render the whole template into one string"""
+        return ''.join(self.render(**values))
+
+@functools.lru_cache(maxsize=None)
+def get_template(name):
+    """Load and parse templates/<name> once per process"""
+    with open(os.path.join(TEMPLATE_DIR, name), encoding='utf-8') as f:
+        return Template(f.read(), name)
+
+def write_fragments(path, fragments, buffer_size=WRITE_BUFFER_SIZE):
+    """Stream fragments to a file through a buffered writer; returns characters written"""
+    written = 0
+    with tracing.span(f"write {path}", 'io'):
+        with open(path, 'w', encoding='utf-8', buffering=buffer_size) as f:
+            for fragment in fragments:
+                f.write(fragment)
+                written += len(fragment)
+    return written
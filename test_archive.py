@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the sharded historical archive (scratch database and docs/ folder)
+"""
+from datetime import date
+import archive
+from fetch_mlb_data import MLBDataFetcher
+
+def game(game_id, away_team, status, first_inning=(None, None)):
+    home_first, away_first = first_inning
+    return {
+        'game_id': str(game_id), 'game_date': '2025-06-01', 'season': 2025,
+        'home_team_name': 'Home Team', 'away_team_name': away_team,
+        'home_pitcher': 'Home Pitcher', 'away_pitcher': 'Away Pitcher',
+        'home_first_runs': home_first, 'away_first_runs': away_first,
+        'home_score': None, 'away_score': None, 'status': status
+    }
+
+def prediction(away_team, pick):
+    return {
+        'game_date': '2025-06-01', 'away_team': away_team, 'home_team': 'Home Team',
+        'prediction': pick, 'yrfi_probability': 0.6, 'confidence': 0.5, 'should_bet': True,
+        'grade': 'B+', 'data_quality': 'good', 'key': f"{away_team}@Home Team"
+    }
+
+def test_refiling_keeps_picks_of_started_games(tmp_path):
+    fetcher = MLBDataFetcher(str(tmp_path / 'games.db'), use_http_cache=False)
+    fetcher.create_tables()
+    fetcher.store_games([game(1, 'Early', 'Scheduled'), game(2, 'Late', 'Scheduled')])
+    docs = str(tmp_path / 'docs')
+
+    archive.update_archive(fetcher.conn, docs, [prediction('Early', 'YRFI'), prediction('Late', 'YRFI')],
+                           today=date(2025, 6, 1))
+
+    # The early game finishes; a later build flips both picks
+    fetcher.store_games([game(1, 'Early', 'Final', (1, 0))])
+    index, _ = archive.update_archive(fetcher.conn, docs, [prediction('Early', 'NRFI'), prediction('Late', 'NRFI')],
+                                      today=date(2025, 6, 1))
+
+    shard = archive.load_shard(str(tmp_path / 'docs' / 'archive'), '2025/06-01.json')
+    picks = {entry['key']: entry['prediction'] for entry in shard['predictions']}
+    assert picks == {'Early@Home Team': 'YRFI', 'Late@Home Team': 'NRFI'}
+    assert (index['dates'][0]['final'], index['dates'][0]['correct']) == (1, 1)
+    fetcher.close()
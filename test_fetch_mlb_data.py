@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for game ingestion into a scratch database (no network access)
+"""
+import sqlite3
+from fetch_mlb_data import MLBDataFetcher
+
+def schedule_game(game_id, status='Final', first_inning=(1, 0), score=(3, 2)):
+    """A schedule entry as returned with the linescore profile"""
+    home_first, away_first = first_inning
+    home_score, away_score = score
+    return {
+        'gamePk': game_id,
+        'season': '2025',
+        'status': {'detailedState': status},
+        'teams': {
+            'home': {'team': {'name': 'Home Team'}, 'probablePitcher': {'fullName': 'Home Pitcher'}},
+            'away': {'team': {'name': 'Away Team'}, 'probablePitcher': {'fullName': 'Away Pitcher'}}
+        },
+        'linescore': {
+            'innings': [{'num': 1, 'home': {'runs': home_first}, 'away': {'runs': away_first}}],
+            'teams': {'home': {'runs': home_score}, 'away': {'runs': away_score}}
+        }
+    }
+
+def slate_game(game_id, status):
+    """A row as built by get_today_games"""
+    return {
+        'game_id': str(game_id), 'game_date': '2025-06-01', 'season': 2025,
+        'home_team_name': 'Home Team', 'away_team_name': 'Away Team',
+        'home_pitcher': 'Home Pitcher', 'away_pitcher': 'Away Pitcher', 'status': status
+    }
+
+def make_fetcher(tmp_path):
+    fetcher = MLBDataFetcher(str(tmp_path / 'games.db'), use_http_cache=False)
+    fetcher.create_tables()
+    return fetcher
+
+def game_row(fetcher, game_id):
+    return fetcher.conn.execute(
+        "SELECT status, home_first_runs, away_first_runs FROM games WHERE game_id = ?", (str(game_id),)
+    ).fetchone()
+
+def league_stats(fetcher):
+    return fetcher.conn.execute(
+        "SELECT season, games, yrfi_count, first_inning_runs FROM league_season_stats"
+    ).fetchall()
+
+def test_slate_never_marks_a_game_final(tmp_path):
+    fetcher = make_fetcher(tmp_path)
+    fetcher.store_slate([slate_game(1, 'Final'), slate_game(2, 'In Progress')])
+
+    assert game_row(fetcher, 1)[0] != 'Final'
+    assert game_row(fetcher, 2)[0] == 'In Progress'
+    assert league_stats(fetcher) in ([], [(2025, 0, 0, 0)])
+
+    # The results pass still stores the game once it reads the linescore
+    written, missing = fetcher.ingest_schedule({'dates': [{'date': '2025-06-01', 'games': [schedule_game(1)]}]})
+    assert (written, missing) == (1, [])
+    assert game_row(fetcher, 1) == ('Final', 1, 0)
+    assert league_stats(fetcher) == [(2025, 1, 1, 1)]
+    fetcher.close()
+
+def test_final_game_without_first_inning_is_refetched(tmp_path):
+    fetcher = make_fetcher(tmp_path)
+    # A Final row missing its first inning, as older slate runs wrote them
+    fetcher.store_games([slate_game(1, 'Final')], columns=tuple(slate_game(1, 'Final')))
+    assert game_row(fetcher, 1) == ('Final', None, None)
+
+    fetcher.ingest_schedule({'dates': [{'date': '2025-06-01', 'games': [schedule_game(1, first_inning=(0, 2))]}]})
+    assert game_row(fetcher, 1) == ('Final', 0, 2)
+    assert league_stats(fetcher) == [(2025, 1, 1, 2)]
+    fetcher.close()
+
+def test_complete_final_game_is_skipped(tmp_path):
+    fetcher = make_fetcher(tmp_path)
+    schedule = {'dates': [{'date': '2025-06-01', 'games': [schedule_game(1)]}]}
+    assert fetcher.ingest_schedule(schedule) == (1, [])
+    assert fetcher.ingest_schedule(schedule) == (0, [])
+    fetcher.close()
+
+def test_game_listed_twice_counts_once(tmp_path):
+    fetcher = make_fetcher(tmp_path)
+    # A resumed game appears under both its original and its resumption date
+    schedule = {'dates': [
+        {'date': '2025-06-01', 'games': [schedule_game(1)]},
+        {'date': '2025-06-02', 'games': [schedule_game(1)]}
+    ]}
+    fetcher.ingest_schedule(schedule)
+
+    assert fetcher.conn.execute("SELECT COUNT(*) FROM games").fetchone() == (1,)
+    assert league_stats(fetcher) == [(2025, 1, 1, 1)]
+    assert fetcher.conn.execute(
+        "SELECT games FROM pitcher_season_stats WHERE pitcher = 'Home Pitcher'"
+    ).fetchone() == (1,)
+    fetcher.close()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk HTTP response cache (scratch files, no network access)
+"""
+from http_cache import HTTPCache, FOREVER
+
+URL = 'https://statsapi.mlb.com/api/v1/game/1/feed/live'
+
+def cache_with_entry(path, source_version):
+    cache = HTTPCache(str(path), source_version=source_version)
+    cache.put(URL, 'game_feed', b'{}', 'etag-1', None, FOREVER)
+    cache.commit(source_version)
+    cache.close()
+
+def test_cache_survives_runs_against_the_same_database(tmp_path):
+    cache_with_entry(tmp_path / 'http_cache.db', 7)
+    cache = HTTPCache(str(tmp_path / 'http_cache.db'), source_version=7)
+    assert cache.get(URL).etag == 'etag-1'
+    cache.close()
+
+def test_cache_is_cleared_for_another_database_state(tmp_path):
+    # e.g. the cache was saved after a run whose database commit never landed
+    cache_with_entry(tmp_path / 'http_cache.db', 7)
+    cache = HTTPCache(str(tmp_path / 'http_cache.db'), source_version=5)
+    assert cache.get(URL) is None
+    cache.close()
+
+    # ...and is kept from then on
+    cache = HTTPCache(str(tmp_path / 'http_cache.db'), source_version=5)
+    assert cache.source_version() == '5'
+    cache.close()
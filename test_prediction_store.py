@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for stored predictions and their grading (scratch database, no network access)
+"""
+import prediction_store
+from fetch_mlb_data import MLBDataFetcher
+
+def game(game_id, status, first_inning=(None, None)):
+    """A full games row"""
+    home_first, away_first = first_inning
+    return {
+        'game_id': str(game_id), 'game_date': '2025-06-01', 'season': 2025,
+        'home_team_name': 'Home Team', 'away_team_name': 'Away Team',
+        'home_pitcher': 'Home Pitcher', 'away_pitcher': 'Away Pitcher',
+        'home_first_runs': home_first, 'away_first_runs': away_first,
+        'home_score': None, 'away_score': None, 'status': status
+    }
+
+def prediction(game_id, pick, confidence):
+    return {
+        'game_id': str(game_id), 'game_date': '2025-06-01', 'prediction': pick,
+        'yrfi_probability': 0.6 if pick == 'YRFI' else 0.4, 'nrfi_probability': 0.4 if pick == 'YRFI' else 0.6,
+        'confidence': confidence, 'should_bet': True, 'data_quality': 'good'
+    }
+
+def make_fetcher(tmp_path):
+    fetcher = MLBDataFetcher(str(tmp_path / 'games.db'), use_http_cache=False)
+    fetcher.create_tables()
+    return fetcher
+
+def stored(fetcher, game_id):
+    return fetcher.conn.execute("""
+        SELECT prediction, confidence, grade, actual, correct
+        FROM predictions WHERE game_id = ?
+    """, (str(game_id),)).fetchone()
+
+def test_graded_prediction_is_frozen(tmp_path):
+    fetcher = make_fetcher(tmp_path)
+    fetcher.store_games([game(1, 'Scheduled')])
+    prediction_store.save_predictions(fetcher.conn, [prediction(1, 'YRFI', 0.65)], 'v-test')
+
+    # The fetcher grades the stored pick as the game goes Final
+    fetcher.store_games([game(1, 'Final', (0, 0))])
+    graded = stored(fetcher, 1)
+    assert graded == ('YRFI', 0.65, 'A', 'NRFI', 0)
+
+    # A post-game re-render must not replace the pre-game pick
+    prediction_store.save_predictions(fetcher.conn, [prediction(1, 'NRFI', 0.75)], 'v-test')
+    assert stored(fetcher, 1) == graded
+    fetcher.close()
+
+def test_prediction_is_frozen_from_first_pitch(tmp_path):
+    fetcher = make_fetcher(tmp_path)
+    fetcher.store_games([game(1, 'Scheduled'), game(2, 'In Progress')])
+    prediction_store.save_predictions(fetcher.conn, [prediction(1, 'YRFI', 0.45)], 'v-test')
+
+    # Updated freely before the game starts
+    prediction_store.save_predictions(fetcher.conn, [prediction(1, 'NRFI', 0.35)], 'v-test')
+    assert stored(fetcher, 1)[:3] == ('NRFI', 0.35, 'C+')
+
+    # Frozen once it is under way; games already started are never added
+    fetcher.store_games([game(1, 'In Progress')])
+    prediction_store.save_predictions(fetcher.conn, [prediction(1, 'YRFI', 0.55), prediction(2, 'YRFI', 0.55)], 'v-test')
+    assert stored(fetcher, 1)[:3] == ('NRFI', 0.35, 'C+')
+    assert stored(fetcher, 2) is None
+    fetcher.close()
@@ -5,18 +5,19 @@ Quick test to get real MLB data for today
 import requests
 import json
 from datetime import datetime
+from mlb_api import MLBApiClient
 
 def test_mlb_api():
     """Test the MLB API to get real current data"""
     today = datetime.now().strftime('%Y-%m-%d')
     print(f"🔍 Checking MLB schedule for {today}...")
     
+    # One pooled session for the schedule and every live feed
+    client = MLBApiClient()
+    
     # Get today's schedule
-    schedule_url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={today}"
     try:
-        response = requests.get(schedule_url)
-        response.raise_for_status()
-        data = response.json()
+        data = client.get_json('schedule', '/schedule', {'sportId': 1, 'date': today})
         
         print(f"✅ API Response successful")
         print(f"📊 Total games today: {data.get('totalGames', 0)}")
@@ -36,13 +37,11 @@ def test_mlb_api():
                     print(f"      ID: {game_id}, Status: {status}")
                     
                     # Try to get live feed for this game
-                    live_url = f"https://statsapi.mlb.com/api/v1/game/{game_id}/feed/live"
                     try:
-                        live_response = requests.get(live_url)
-                        if live_response.status_code == 200:
-                            print(f"      ✅ Live data available")
-                        else:
-                            print(f"      ❌ Live data not available: {live_response.status_code}")
+                        client.get('game_feed', f"/game/{game_id}/feed/live")
+                        print(f"      ✅ Live data available")
+                    except requests.HTTPError as e:
+                        print(f"      ❌ Live data not available: {e.response.status_code}")
                     except Exception as e:
                         print(f"      ❌ Error getting live data: {e}")
         else:
@@ -50,6 +49,9 @@ def test_mlb_api():
             
     except Exception as e:
         print(f"❌ Error: {e}")
+    
+    client.print_stats()
+    client.close()
 
 if __name__ == "__main__":
     test_mlb_api()
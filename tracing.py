@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Lightweight Tracing for the Daily Pipeline
+
+Records timed spans (API fetches, SQL queries, game scoring, file writes)
+and writes them as a Chrome trace-event JSON file that opens in
+chrome://tracing or https://ui.perfetto.dev, plus a slowest-spans summary.
+
+Tracing is off unless a script is run with --trace; a disabled span() is a
+single flag check returning a shared no-op context manager.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+DEFAULT_TRACE_PATH = 'trace.json'
+SUMMARY_TOP_N = 15
+
+_enabled = False
+_events = []
+_trace_path = DEFAULT_TRACE_PATH
+_start = time.perf_counter()
+
+class _NullSpan:
+    """No-op span used while tracing is disabled"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        _events.append({
+            'name': self.name,
+            'cat': self.category,
+            'ph': 'X',
+            'ts': (self.begin - _start) * 1e6,
+            'dur': (end - self.begin) * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': self.args
+        })
+        return False
+
+def span(name, category='pipeline', **args):
+    """Time a block as a trace span: ``with tracing.span('fetch schedule', 'http'):``"""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+def traced(name=None, category='pipeline'):
+    """Decorator form of span() using the function name by default"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def is_enabled():
+    """Whether spans are currently being recorded"""
+    return _enabled
+
+def enable(trace_path=DEFAULT_TRACE_PATH):
+    """Start recording spans and write the trace when the process exits"""
+    global _enabled, _trace_path
+    if not _enabled:
+        atexit.register(finish)
+    _enabled = True
+    _trace_path = trace_path
+
+def enable_from_argv(argv, default_path=DEFAULT_TRACE_PATH):
+    """Enable tracing for ``--trace`` / ``--trace=PATH`` and return argv without it"""
+    remaining = []
+    for arg in argv:
+        if arg == '--trace':
+            enable(default_path)
+        elif arg.startswith('--trace='):
+            enable(arg.split('=', 1)[1])
+        else:
+            remaining.append(arg)
+    return remaining
+
+def write_chrome_trace(path):
+    """Write recorded spans in Chrome trace-event format"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': _events, 'displayTimeUnit': 'ms'}, f)
+
+def print_summary(top_n=SUMMARY_TOP_N):
+    """Print the slowest individual spans and total time per span name"""
+    if not _events:
+        return
+
+    print(f"\n⏱️ Slowest {min(top_n, len(_events))} spans")
+    print("-" * 60)
+    for event in sorted(_events, key=lambda e: e['dur'], reverse=True)[:top_n]:
+        print(f"{event['dur'] / 1000:10.1f} ms  [{event['cat']}] {event['name']}")
+
+    totals = {}
+    for event in _events:
+        count, total = totals.get(event['name'], (0, 0.0))
+        totals[event['name']] = (count + 1, total + event['dur'])
+
+    print(f"\n⏱️ Total time by span (top {min(top_n, len(totals))})")
+    print("-" * 60)
+    for span_name, (count, total) in sorted(totals.items(), key=lambda t: t[1][1], reverse=True)[:top_n]:
+        print(f"{total / 1000:10.1f} ms  {count:>5}x  {span_name}")
+
+def finish():
+    """Write the trace file and summary (registered with atexit by enable())"""
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    write_chrome_trace(_trace_path)
+    print_summary()
+    print(f"\n📄 Trace written to {_trace_path} (open in chrome://tracing or ui.perfetto.dev)")